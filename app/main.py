@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+import io
 import json
+import math
 import sys
+from collections import namedtuple
 from pathlib import Path
 
+import altair as alt
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.append(str(ROOT))
@@ -17,11 +28,11 @@ if str(ROOT) not in sys.path:
 from src.adapters.land_registry import LandRegistryCSVIngestor
 from src.adapters.rates_adapter import RatesSeriesAdapter
 from src.db.base import get_engine, get_session_factory, session_scope
-from src.db.repository import add_rates, average_rent_for_postcode, get_listing_by_id, list_listings
+from src.db.repository import add_rates, average_rent_for_postcode, get_listing_by_id, list_listing_records
 from src.features.engineering import build_feature_bundle
 from src.scenarios.deterministic import run_standard_scenarios
 from src.scenarios.monte_carlo import MonteCarloConfig, run_monte_carlo
-from src.underwriting.engine import UnderwritingEngine
+from src.underwriting.engine import UnderwritingEngine, UnderwritingResult
 from src.underwriting.models import (
     AcquisitionCosts,
     ExitAssumptions,
@@ -39,13 +50,92 @@ from src.utils.config import (
 st.set_page_config(page_title="UK Underwriting Engine", page_icon="🏠", layout="wide")
 
 
+def _warm_up_models() -> None:
+    """Exercise the model once so first-call setup is paid at startup, not on the first click.
+
+    Only the single-run engine path (scalar, serial kernels) is warmed here;
+    Monte Carlo's batch kernels compile on first use rather than as a side
+    effect of building the cached runtime.
+    """
+
+    warm_inputs = UnderwritingInputs(
+        purchase_price=100_000,
+        acquisition_costs=AcquisitionCosts(stamp_duty=0.0),
+        rental=RentalAssumptions(market_rent_monthly=500),
+        financing=FinancingAssumptions(),
+        exit=ExitAssumptions(hold_years=1),
+    )
+    UnderwritingEngine().run(warm_inputs)
+
+
 @st.cache_resource
 def get_runtime(db_url: str):
     engine = get_engine(db_url)
     bootstrap_database(engine)
+    _warm_up_models()
     return engine, get_session_factory(engine)
 
 
+LISTING_FIELDS = (
+    "id",
+    "address",
+    "postcode",
+    "lat",
+    "lon",
+    "asking_price",
+    "bedrooms",
+    "bathrooms",
+    "property_type",
+    "floor_area_sqft",
+    "listing_date",
+    "source",
+)
+ListingView = namedtuple("ListingView", LISTING_FIELDS)
+
+
+@st.cache_data(ttl=300)
+def _cached_list_listings(db_url: str) -> list[dict]:
+    # Plain dicts keep the cache pickle-safe; ORM rows would detach from their session.
+    _, factory = get_runtime(db_url)
+    with session_scope(factory) as session:
+        return [{name: row[name] for name in LISTING_FIELDS} for row in list_listing_records(session)]
+
+
+@st.cache_data(ttl=300)
+def _cached_listing_options(db_url: str) -> dict[str, int]:
+    df = pd.DataFrame(_cached_list_listings(db_url), columns=["id", "address", "postcode", "asking_price"])
+    labels = (
+        df["id"].astype(str)
+        + " | "
+        + df["address"]
+        + " | "
+        + df["postcode"]
+        + " | £"
+        + df["asking_price"].map("{:,.0f}".format)
+    )
+    return dict(zip(labels, df["id"].tolist()))
+
+
+@st.cache_data(ttl=300)
+def _cached_avg_rent(db_url: str, postcode: str) -> float | None:
+    _, factory = get_runtime(db_url)
+    with session_scope(factory) as session:
+        return average_rent_for_postcode(session, postcode)
+
+
+@st.cache_data(ttl=600)
+def _cached_features(db_url: str, listing_id: int, market_rent: float, purchase_price: float) -> dict:
+    # A single transaction covers the listing lookup and every feature query.
+    _, factory = get_runtime(db_url)
+    with session_scope(factory) as session:
+        return build_feature_bundle(
+            session=session,
+            listing=get_listing_by_id(session, listing_id),
+            market_rent_monthly=market_rent,
+            purchase_price=purchase_price,
+        )
+
+
 def _money(value: float | None) -> str:
     return "N/A" if value is None else f"£{value:,.0f}"
 
@@ -55,22 +145,97 @@ def _pct(value: float | None) -> str:
 
 
 def _safe_float(value: float | None, fallback: float) -> float:
-    return fallback if value is None or (isinstance(value, float) and np.isnan(value)) else float(value)
+    return fallback if value is None or (isinstance(value, float) and math.isnan(value)) else float(value)
+
+
+@st.cache_data(show_spinner=False)
+def _line_chart(df: pd.DataFrame, y: str) -> alt.Chart:
+    data = df[["date", y]].assign(date=pd.to_datetime(df["date"]))
+    return alt.Chart(data).mark_line().encode(x=alt.X("date:T", title=None), y=alt.Y(f"{y}:Q"))
+
+
+def _histogram(values: np.ndarray, nbins: int = 30) -> tuple[np.ndarray, np.ndarray]:
+    """Equal-width histogram via integer bucketing and ``np.bincount``."""
+
+    lo, hi = float(values.min()), float(values.max())
+    if hi == lo:
+        lo, hi = lo - 0.5, hi + 0.5
+    idx = np.clip(((values - lo) / (hi - lo) * nbins).astype(np.int32), 0, nbins - 1)
+    return np.bincount(idx, minlength=nbins), np.linspace(lo, hi, nbins + 1)
+
+
+@st.cache_data(show_spinner=False)
+def _irr_histogram_chart(irr_values: np.ndarray) -> alt.Chart:
+    counts, bins = _histogram(irr_values, nbins=30)
+    hist_df = pd.DataFrame({"IRR (%)": bins[:-1], "count": counts})
+    return alt.Chart(hist_df).mark_bar().encode(x=alt.X("IRR (%):Q"), y=alt.Y("count:Q"))
+
+
+_JSON_DISPATCH = {
+    np.float64: float,
+    np.float32: float,
+    np.int64: int,
+    np.int32: int,
+    np.bool_: bool,
+    pd.Timestamp: pd.Timestamp.isoformat,
+}
 
 
 def _json_default(value):
-    if isinstance(value, (np.floating, np.integer)):
+    handler = _JSON_DISPATCH.get(type(value))
+    if handler is not None:
+        return handler(value)
+    if isinstance(value, (np.floating, np.integer, np.bool_)):
         return value.item()
-    if isinstance(value, pd.Timestamp):
-        return value.isoformat()
     if hasattr(value, "isoformat"):
         return value.isoformat()
     raise TypeError(f"Unsupported type for JSON serialization: {type(value)!r}")
 
 
+@st.cache_data(show_spinner=False)
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    buffer = io.BytesIO()
+    pacsv.write_csv(
+        pa.Table.from_pandas(df, preserve_index=False),
+        buffer,
+        write_options=pacsv.WriteOptions(quoting_style="needed"),
+    )
+    return buffer.getvalue()
+
+
+def _export_json(payload: dict) -> bytes | str:
+    # orjson encodes NumPy scalars/arrays natively, so _json_default only sees the leftovers.
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload, indent=2, default=_json_default)
+
+
 _engine_sql, session_factory = get_runtime(DEFAULT_DB_URL)
 model_engine = UnderwritingEngine()
 
+
+@st.cache_data(show_spinner=False)
+def _cached_underwriting(
+    inputs_json: str,
+    n_sims: int,
+    hurdle_irr: float,
+) -> tuple[UnderwritingResult, pd.DataFrame, dict]:
+    """Run base case, deterministic scenarios and Monte Carlo once per distinct set of assumptions."""
+
+    assumptions = UnderwritingInputs.from_dict(json.loads(inputs_json))
+    result = model_engine.run(assumptions)
+    scenario_df = run_standard_scenarios(assumptions, engine=model_engine, base_result=result)
+    mc = run_monte_carlo(
+        base_inputs=assumptions,
+        config=MonteCarloConfig(
+            n_simulations=n_sims,
+            target_hurdle_irr=hurdle_irr,
+        ),
+        engine=model_engine,
+    )
+    return result, scenario_df, mc
+
+
 st.title("Automated Real Estate Underwriting Engine (UK)")
 st.caption("Offline-ready underwriting with modular ingestion, deterministic scenarios, and Monte Carlo simulation.")
 
@@ -83,6 +248,7 @@ with st.sidebar:
         try:
             with session_scope(session_factory) as session:
                 inserted = LandRegistryCSVIngestor().ingest(session, land_registry_path)
+            st.cache_data.clear()
             st.success(f"Inserted {inserted} transaction rows.")
         except Exception as exc:
             st.error(f"Failed to ingest Land Registry data: {exc}")
@@ -92,40 +258,29 @@ with st.sidebar:
             with session_scope(session_factory) as session:
                 records = RatesSeriesAdapter().load(rates_path)
                 inserted = add_rates(session, records)
+            st.cache_data.clear()
             st.success(f"Inserted {inserted} rate rows.")
         except Exception as exc:
             st.error(f"Failed to ingest rates data: {exc}")
 
-with session_scope(session_factory) as session:
-    listings = list_listings(session)
+listings = [ListingView(**row) for row in _cached_list_listings(DEFAULT_DB_URL)]
 
 if not listings:
     st.error("No listings available. Add listings via sample data/bootstrap before underwriting.")
     st.stop()
 
-listing_options = {
-    f"{l.id} | {l.address} | {l.postcode} | £{l.asking_price:,.0f}": l.id for l in listings
-}
+listing_options = _cached_listing_options(DEFAULT_DB_URL)
 selected_label = st.selectbox("Select Property", options=list(listing_options.keys()))
 selected_id = listing_options[selected_label]
 
-with session_scope(session_factory) as session:
-    selected_listing = get_listing_by_id(session, selected_id)
-    avg_rent = average_rent_for_postcode(session, selected_listing.postcode) if selected_listing else None
-
+selected_listing = next((listing for listing in listings if listing.id == selected_id), None)
 if selected_listing is None:
     st.error("Selected listing not found.")
     st.stop()
 
+avg_rent = _cached_avg_rent(DEFAULT_DB_URL, selected_listing.postcode)
 default_rent = avg_rent if avg_rent is not None else (selected_listing.asking_price * 0.05 / 12)
-
-with session_scope(session_factory) as session:
-    feature_preview = build_feature_bundle(
-        session=session,
-        listing=selected_listing,
-        market_rent_monthly=default_rent,
-        purchase_price=selected_listing.asking_price,
-    )
+feature_preview = _cached_features(DEFAULT_DB_URL, selected_listing.id, default_rent, selected_listing.asking_price)
 
 tab_selection, tab_underwrite = st.tabs(["Property Selection", "Underwriting Dashboard"])
 
@@ -249,15 +404,10 @@ with tab_underwrite:
                 target_hurdle_irr=hurdle_irr,
             )
 
-            result = model_engine.run(assumptions)
-            scenario_df = run_standard_scenarios(assumptions, engine=model_engine)
-            mc = run_monte_carlo(
-                base_inputs=assumptions,
-                config=MonteCarloConfig(
-                    n_simulations=int(n_sims),
-                    target_hurdle_irr=hurdle_irr,
-                ),
-                engine=model_engine,
+            result, scenario_df, mc = _cached_underwriting(
+                json.dumps(assumptions.to_dict(), sort_keys=True),
+                int(n_sims),
+                float(hurdle_irr),
             )
 
             export_payload = result.to_dict()
@@ -298,21 +448,19 @@ with tab_underwrite:
         st.dataframe(result.debt_schedule, use_container_width=True)
 
         st.subheader("Charts")
-        cf_chart_df = result.monthly_cash_flows.loc[result.monthly_cash_flows["month"] > 0, ["date", "levered_cf"]].set_index("date")
+        cf_chart_df = result.monthly_cash_flows.loc[result.monthly_cash_flows["month"] > 0, ["date", "levered_cf"]]
         st.markdown("Cash Flow Over Time")
-        st.line_chart(cf_chart_df)
+        st.altair_chart(_line_chart(cf_chart_df, "levered_cf"), use_container_width=True)
 
-        dscr_df = result.monthly_cash_flows[["date", "dscr"]].dropna().set_index("date")
+        dscr_df = result.monthly_cash_flows[["date", "dscr"]].dropna()
         if not dscr_df.empty:
             st.markdown("DSCR Over Time")
-            st.line_chart(dscr_df)
+            st.altair_chart(_line_chart(dscr_df, "dscr"), use_container_width=True)
 
         st.markdown("Monte Carlo IRR Distribution")
         irr_values = (mc["simulations"]["irr"].dropna() * 100).to_numpy()
         if irr_values.size > 0:
-            counts, bins = np.histogram(irr_values, bins=30)
-            hist_df = pd.DataFrame({"IRR (%)": bins[:-1], "count": counts}).set_index("IRR (%)")
-            st.bar_chart(hist_df)
+            st.altair_chart(_irr_histogram_chart(irr_values), use_container_width=True)
         else:
             st.info("No valid IRR outcomes available for histogram.")
 
@@ -327,19 +475,19 @@ with tab_underwrite:
         st.subheader("Export")
         st.download_button(
             label="Export Underwriting JSON",
-            data=json.dumps(export_payload, indent=2, default=_json_default),
+            data=_export_json(export_payload),
             file_name="underwriting_result.json",
             mime="application/json",
         )
         st.download_button(
             label="Export Annual Cash Flows CSV",
-            data=result.annual_cash_flows.to_csv(index=False),
+            data=_csv_bytes(result.annual_cash_flows),
             file_name="annual_cash_flows.csv",
             mime="text/csv",
         )
         st.download_button(
             label="Export Debt Schedule CSV",
-            data=result.debt_schedule.to_csv(index=False),
+            data=_csv_bytes(result.debt_schedule),
             file_name="debt_schedule.csv",
             mime="text/csv",
         )
@@ -0,0 +1,68 @@
+"""Shared helpers for CSV-backed adapters."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - exercised only without pyarrow installed
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+# Bounds on how much of a CSV is materialised at once when streaming.
+CSV_CHUNK_ROWS = 100_000
+CSV_BLOCK_BYTES = 16 << 20
+
+
+def read_csv(path: str | Path) -> pd.DataFrame:
+    """Read a CSV file, preferring the multithreaded PyArrow parser when available."""
+
+    if HAS_PYARROW:
+        return pd.read_csv(path, engine="pyarrow")
+    return pd.read_csv(path)
+
+
+def read_csv_header(path: str | Path) -> list[str]:
+    """Return the header row of a CSV file without parsing the body."""
+
+    with open(path, newline="", encoding="utf-8-sig") as handle:
+        return next(csv.reader(handle), [])
+
+
+def iter_csv_chunks(path: str | Path, columns: list[str]) -> Iterator[pd.DataFrame]:
+    """Yield ``columns`` of a CSV as successive string-typed DataFrames.
+
+    Every column is read as text so type inference on one block can never
+    conflict with a later block; callers coerce types per chunk.
+    """
+
+    if HAS_PYARROW:
+        reader = pacsv.open_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_BYTES),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                column_types={name: pa.string() for name in columns},
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            yield batch.to_pandas()
+        return
+
+    yield from pd.read_csv(path, usecols=columns, dtype=str, chunksize=CSV_CHUNK_ROWS)
+
+
+def clean_optional_text(series: pd.Series) -> pd.Series:
+    """Strip whitespace and map blank or missing values to ``None``."""
+
+    text = series.astype("string").str.strip()
+    keep = text.fillna("").ne("")
+    return text.astype(object).where(keep, None)
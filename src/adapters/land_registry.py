@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
-import datetime as dt
 from pathlib import Path
 
 import pandas as pd
 from sqlalchemy.orm import Session
 
-from src.db.repository import add_transactions
+from src.adapters.csv_utils import clean_optional_text, iter_csv_chunks, read_csv_header
+from src.db.repository import add_transaction_columns
 
 
 class LandRegistryCSVIngestor:
@@ -37,40 +37,33 @@ class LandRegistryCSVIngestor:
         if not path.exists():
             raise FileNotFoundError(f"Land Registry CSV not found: {path}")
 
-        df = pd.read_csv(path)
-        lowered = {col.lower().strip(): col for col in df.columns}
+        header = read_csv_header(path)
+        lowered = {col.lower().strip(): col for col in header}
         missing = [col for col in self.REQUIRED_COLUMNS if col not in lowered]
         if missing:
             raise ValueError(f"Land Registry CSV missing columns: {', '.join(missing)}")
 
-        renamed = {
-            lowered[src]: dst
-            for src, dst in self.REQUIRED_COLUMNS.items()
-            if src in lowered
-        }
-        work = df.rename(columns=renamed).copy()
-        work = work[list(self.REQUIRED_COLUMNS.values())]
-        work["date"] = pd.to_datetime(work["date"], errors="coerce").dt.date
-        work["price_paid"] = pd.to_numeric(work["price_paid"], errors="coerce")
+        renamed = {lowered[src]: dst for src, dst in self.REQUIRED_COLUMNS.items()}
 
-        work = work.dropna(subset=["postcode", "price_paid", "date"])
-        if work.empty:
-            return 0
+        # Stream the file so memory is bounded by one chunk, inserting as we go.
+        inserted = 0
+        for chunk in iter_csv_chunks(path, list(renamed)):
+            inserted += add_transaction_columns(session, self._chunk_columns(chunk.rename(columns=renamed)))
+        return inserted
 
-        records = []
-        for _, row in work.iterrows():
-            date_value = row["date"]
-            if not isinstance(date_value, dt.date):
-                continue
-            records.append(
-                {
-                    "postcode": str(row["postcode"]).upper().strip(),
-                    "price_paid": float(row["price_paid"]),
-                    "date": date_value,
-                    "property_type": str(row.get("property_type", "")).strip() or None,
-                    "new_build": str(row.get("new_build", "")).strip() or None,
-                    "tenure": str(row.get("tenure", "")).strip() or None,
-                }
-            )
+    def _chunk_columns(self, chunk: pd.DataFrame) -> dict[str, list]:
+        """Normalise one chunk into parallel column lists for ``add_transaction_columns``."""
 
-        return add_transactions(session, records)
+        work = chunk[list(self.REQUIRED_COLUMNS.values())]
+        work["date"] = pd.to_datetime(work["date"], errors="coerce")
+        work["price_paid"] = pd.to_numeric(work["price_paid"], errors="coerce")
+        work = work.dropna(subset=["postcode", "price_paid", "date"])
+
+        return {
+            "postcode": work["postcode"].astype(str).str.upper().str.strip().tolist(),
+            "price_paid": work["price_paid"].astype(float).tolist(),
+            "date": work["date"].dt.date.tolist(),
+            "property_type": clean_optional_text(work["property_type"]).tolist(),
+            "new_build": clean_optional_text(work["new_build"]).tolist(),
+            "tenure": clean_optional_text(work["tenure"]).tolist(),
+        }
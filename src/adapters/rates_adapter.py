@@ -7,6 +7,15 @@ from pathlib import Path
 
 import pandas as pd
 
+from src.adapters.csv_utils import read_csv
+
+
+def _parse_curve(curve: list[dict]) -> tuple[tuple[dt.date, str, float], ...]:
+    return tuple(
+        (dt.date.fromisoformat(point["date"]), point["rate_name"], float(point["value"]))
+        for point in curve
+    )
+
 
 class RatesSeriesAdapter:
     """Load historical rates from CSV or return a default curve."""
@@ -19,6 +28,8 @@ class RatesSeriesAdapter:
         {"date": "2025-01-01", "rate_name": "policy_proxy", "value": 0.0475},
         {"date": "2025-07-01", "rate_name": "policy_proxy", "value": 0.0450},
     ]
+    # Parsed once at import; the curve is constant.
+    _FALLBACK_PARSED = _parse_curve(FALLBACK_CURVE)
 
     def load(self, csv_path: str | Path | None = None) -> list[dict]:
         if csv_path is None:
@@ -28,37 +39,31 @@ class RatesSeriesAdapter:
         if not path.exists():
             return self._fallback_records()
 
-        df = pd.read_csv(path)
+        df = read_csv(path)
         lowered = {col.lower().strip(): col for col in df.columns}
         required = {"date", "rate_name", "value"}
         if not required.issubset(lowered):
             raise ValueError("Rates CSV must include columns: date, rate_name, value")
 
-        work = df.rename(columns={lowered[k]: k for k in required}).copy()
-        work["date"] = pd.to_datetime(work["date"], errors="coerce").dt.date
+        work = df.rename(columns={lowered[k]: k for k in required})
+        # Unparseable dates become NaT and drop with the other missing values,
+        # so every remaining row converts cleanly to a date.
+        work["date"] = pd.to_datetime(work["date"], errors="coerce")
         work["value"] = pd.to_numeric(work["value"], errors="coerce")
         work = work.dropna(subset=["date", "rate_name", "value"])
 
-        records: list[dict] = []
-        for _, row in work.iterrows():
-            date_value = row["date"]
-            if not isinstance(date_value, dt.date):
-                continue
-            records.append(
-                {
-                    "date": date_value,
-                    "rate_name": str(row["rate_name"]).strip(),
-                    "value": float(row["value"]),
-                }
-            )
+        records = (
+            work.assign(
+                date=work["date"].dt.date,
+                rate_name=work["rate_name"].astype(str).str.strip(),
+                value=work["value"].astype(float),
+            )[["date", "rate_name", "value"]]
+            .to_dict(orient="records")
+        )
         return records if records else self._fallback_records()
 
     def _fallback_records(self) -> list[dict]:
         return [
-            {
-                "date": dt.datetime.strptime(point["date"], "%Y-%m-%d").date(),
-                "rate_name": point["rate_name"],
-                "value": float(point["value"]),
-            }
-            for point in self.FALLBACK_CURVE
+            {"date": date, "rate_name": rate_name, "value": value}
+            for date, rate_name, value in self._FALLBACK_PARSED
         ]
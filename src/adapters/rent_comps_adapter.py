@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import datetime as dt
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
+from src.adapters.csv_utils import clean_optional_text, read_csv
 from src.db.repository import add_rent_comps
 
 
@@ -28,37 +29,40 @@ class RentCompsCSVIngestor:
         if not path.exists():
             raise FileNotFoundError(f"Rent comps CSV not found: {path}")
 
-        df = pd.read_csv(path)
+        df = read_csv(path)
         lowered = {col.lower().strip(): col for col in df.columns}
         missing = [k for k in self.REQUIRED_COLUMNS if k not in lowered]
         if missing:
             raise ValueError(f"Rent comps CSV missing columns: {', '.join(missing)}")
 
         renamed = {lowered[src]: dst for src, dst in self.REQUIRED_COLUMNS.items()}
-        work = df.rename(columns=renamed).copy()
+        work = df.rename(columns=renamed)
         work = work[list(self.REQUIRED_COLUMNS.values())]
 
         work["monthly_rent"] = pd.to_numeric(work["monthly_rent"], errors="coerce")
         work["bedrooms"] = pd.to_numeric(work["bedrooms"], errors="coerce").astype("Int64")
-        work["date"] = pd.to_datetime(work["date"], errors="coerce").dt.date
+        # Unparseable dates become NaT and drop with the other missing values.
+        work["date"] = pd.to_datetime(work["date"], errors="coerce")
         work = work.dropna(subset=["postcode", "monthly_rent", "date", "source"])
 
-        records: list[dict] = []
-        for _, row in work.iterrows():
-            date_value = row["date"]
-            if not isinstance(date_value, dt.date):
-                continue
-            bedrooms = row.get("bedrooms")
-            bedrooms_int = int(bedrooms) if pd.notna(bedrooms) else None
-            records.append(
-                {
-                    "postcode": str(row["postcode"]).upper().strip(),
-                    "monthly_rent": float(row["monthly_rent"]),
-                    "bedrooms": bedrooms_int,
-                    "property_type": str(row.get("property_type", "")).strip() or None,
-                    "date": date_value,
-                    "source": str(row.get("source", "")).strip(),
-                }
-            )
+        postcodes = work["postcode"].astype(str).str.upper().str.strip().to_numpy()
+        rents = work["monthly_rent"].to_numpy(dtype=np.float64)
+        bedrooms = work["bedrooms"].to_numpy(dtype=object, na_value=None)
+        property_types = clean_optional_text(work["property_type"]).to_numpy()
+        dates = work["date"].dt.date.to_numpy()
+        sources = work["source"].astype(str).str.strip().to_numpy()
 
+        records = [
+            {
+                "postcode": postcode,
+                "monthly_rent": float(rent),
+                "bedrooms": int(beds) if beds is not None else None,
+                "property_type": property_type,
+                "date": date_value,
+                "source": source,
+            }
+            for postcode, rent, beds, property_type, date_value, source in zip(
+                postcodes, rents, bedrooms, property_types, dates, sources
+            )
+        ]
         return add_rent_comps(session, records)
@@ -6,24 +6,69 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Iterator
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "data" / "underwriting.db"
 
+# Room for every statement shape the repository issues, with headroom; the
+# default of 500 compiled entries can churn under mixed UI and ingest traffic.
+QUERY_CACHE_SIZE = 1_200
+
 
 def get_engine(db_url: str | None = None) -> Engine:
     """Create a SQLAlchemy engine.
 
     The default database lives in ``data/underwriting.db`` to keep the whole
-    project self-contained and offline friendly.
+    project self-contained and offline friendly. File-backed SQLite already
+    gets a ``QueuePool`` that reuses connections; in-memory databases share a
+    single ``StaticPool`` connection so every thread sees the same data.
+    Server databases get a larger pool with pre-ping so stale connections are
+    replaced instead of failing the first query after an idle period.
     """
 
     if db_url is None:
         DEFAULT_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
         db_url = f"sqlite:///{DEFAULT_DB_PATH.as_posix()}"
-    return create_engine(db_url, future=True)
+
+    url = make_url(db_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        engine = create_engine(
+            url,
+            future=True,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            query_cache_size=QUERY_CACHE_SIZE,
+        )
+    elif url.get_backend_name() == "sqlite":
+        engine = create_engine(url, future=True, query_cache_size=QUERY_CACHE_SIZE)
+    else:
+        engine = create_engine(
+            url,
+            future=True,
+            pool_pre_ping=True,
+            pool_size=20,
+            query_cache_size=QUERY_CACHE_SIZE,
+        )
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Favour write throughput for bulk ingestion on every new SQLite connection."""
+
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+    finally:
+        cursor.close()
 
 
 def get_session_factory(engine: Engine) -> sessionmaker[Session]:
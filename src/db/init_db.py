@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+from sqlalchemy import inspect
 from sqlalchemy.engine import Engine
 
 from src.db.models import Base
 
 
 def init_db(engine: Engine) -> None:
-    """Auto-create all tables if they do not yet exist."""
+    """Auto-create all tables if they do not yet exist.
 
-    Base.metadata.create_all(bind=engine)
+    One table-name lookup covers the common case of an already initialized
+    database, instead of ``create_all`` probing for each table in turn.
+    """
+
+    existing = set(inspect(engine).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(bind=engine, tables=missing)
@@ -3,53 +3,88 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import asdict, is_dataclass
-from typing import Iterable, Sequence
+from dataclasses import fields, is_dataclass
+from typing import Iterable, Mapping, Sequence
 
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, delete, extract, func, insert, select
 from sqlalchemy.orm import Session
 
 from src.db.models import Listing, Rate, RentComp, Transaction
 
+INSERT_CHUNK_SIZE = 10_000
+
+# Lookups run once per listing or page render; building them once keeps the
+# per-call cost to binding a parameter and a compiled-cache hit.
+_LATEST_RATE_STMT = (
+    select(Rate.value)
+    .where(Rate.rate_name == bindparam("rate_name"))
+    .order_by(Rate.date.desc())
+    .limit(1)
+)
+_AVERAGE_RENT_STMT = select(func.avg(RentComp.monthly_rent)).where(RentComp.postcode == bindparam("postcode"))
+
 
 def _normalize_item(item: object) -> dict:
     if is_dataclass(item):
-        return asdict(item)
+        # Record fields are flat scalars, so a shallow dict is enough; asdict deep-copies.
+        return {f.name: getattr(item, f.name) for f in fields(item)}
     if isinstance(item, dict):
         return item
     raise TypeError(f"Unsupported item type: {type(item)!r}")
 
 
+def _bulk_insert(session: Session, model: type, payload: list[dict], chunk_size: int = INSERT_CHUNK_SIZE) -> int:
+    """Insert ``payload`` through Core ``executemany`` batches, bypassing the unit of work."""
+
+    for start in range(0, len(payload), chunk_size):
+        session.execute(insert(model), payload[start : start + chunk_size])
+    return len(payload)
+
+
 def add_listings(session: Session, listings: Iterable[dict | object]) -> int:
     payload = [_normalize_item(item) for item in listings]
     if not payload:
         return 0
-    session.add_all([Listing(**row) for row in payload])
-    return len(payload)
+    return _bulk_insert(session, Listing, payload)
 
 
 def add_transactions(session: Session, transactions: Iterable[dict | object]) -> int:
     payload = [_normalize_item(item) for item in transactions]
     if not payload:
         return 0
-    session.add_all([Transaction(**row) for row in payload])
-    return len(payload)
+    return _bulk_insert(session, Transaction, payload)
+
+
+def add_transaction_columns(
+    session: Session,
+    columns: Mapping[str, Sequence],
+    chunk_size: int = INSERT_CHUNK_SIZE,
+) -> int:
+    """Insert transactions from parallel column sequences, e.g. one parsed CSV chunk.
+
+    Rows go through the same Core ``executemany`` path as :func:`add_transactions`,
+    so column types (``datetime.date`` for ``date``) are bound by the dialect.
+    """
+
+    names = list(columns)
+    payload = [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))]
+    if not payload:
+        return 0
+    return _bulk_insert(session, Transaction, payload, chunk_size)
 
 
 def add_rent_comps(session: Session, comps: Iterable[dict | object]) -> int:
     payload = [_normalize_item(item) for item in comps]
     if not payload:
         return 0
-    session.add_all([RentComp(**row) for row in payload])
-    return len(payload)
+    return _bulk_insert(session, RentComp, payload)
 
 
 def add_rates(session: Session, rates: Iterable[dict | object]) -> int:
     payload = [_normalize_item(item) for item in rates]
     if not payload:
         return 0
-    session.add_all([Rate(**row) for row in payload])
-    return len(payload)
+    return _bulk_insert(session, Rate, payload)
 
 
 def list_listings(session: Session) -> list[Listing]:
@@ -57,6 +92,13 @@ def list_listings(session: Session) -> list[Listing]:
     return list(session.scalars(stmt).all())
 
 
+def list_listing_records(session: Session) -> list[dict]:
+    """Listings as plain column dicts, in :func:`list_listings` order, without ORM hydration."""
+
+    stmt = select(*Listing.__table__.columns).order_by(Listing.listing_date.desc(), Listing.id.asc())
+    return [dict(row) for row in session.execute(stmt).mappings()]
+
+
 def get_listing_by_id(session: Session, listing_id: int) -> Listing | None:
     stmt = select(Listing).where(Listing.id == listing_id)
     return session.scalars(stmt).first()
@@ -71,19 +113,12 @@ def list_rates(session: Session, rate_name: str | None = None) -> list[Rate]:
 
 
 def latest_rate_value(session: Session, rate_name: str) -> float | None:
-    stmt = (
-        select(Rate.value)
-        .where(Rate.rate_name == rate_name)
-        .order_by(Rate.date.desc())
-        .limit(1)
-    )
-    value = session.scalar(stmt)
+    value = session.scalar(_LATEST_RATE_STMT, {"rate_name": rate_name})
     return float(value) if value is not None else None
 
 
 def average_rent_for_postcode(session: Session, postcode: str) -> float | None:
-    stmt = select(func.avg(RentComp.monthly_rent)).where(RentComp.postcode == postcode)
-    value = session.scalar(stmt)
+    value = session.scalar(_AVERAGE_RENT_STMT, {"postcode": postcode})
     return float(value) if value is not None else None
 
 
@@ -92,6 +127,45 @@ def transactions_for_postcode(session: Session, postcode: str) -> list[Transacti
     return list(session.scalars(stmt).all())
 
 
+def postcode_stats_bulk(session: Session, postcodes: Iterable[str]) -> dict[str, dict[str, float | int | None]]:
+    """Transaction count, average price and price trend per postcode in one grouped query.
+
+    ``monthly_slope`` is the least-squares slope of price paid against the
+    calendar month index (``None`` with fewer than two distinct months). It is
+    assembled from portable ``SUM`` aggregates rather than ``regr_slope`` so
+    the same query runs on SQLite. Postcodes without transactions are omitted.
+    """
+
+    wanted = list(dict.fromkeys(postcodes))
+    if not wanted:
+        return {}
+
+    # Month index relative to 2000-01 keeps the sums of squares small enough
+    # that the slope does not lose precision to cancellation.
+    x = (extract("year", Transaction.date) - 2000) * 12 + extract("month", Transaction.date)
+    y = Transaction.price_paid
+    stmt = (
+        select(
+            Transaction.postcode,
+            func.count(),
+            func.avg(y),
+            func.sum(x),
+            func.sum(x * x),
+            func.sum(y),
+            func.sum(x * y),
+        )
+        .where(Transaction.postcode.in_(wanted))
+        .group_by(Transaction.postcode)
+    )
+
+    stats: dict[str, dict[str, float | int | None]] = {}
+    for postcode, n, avg_price, sum_x, sum_xx, sum_y, sum_xy in session.execute(stmt):
+        sxx = n * float(sum_xx) - float(sum_x) ** 2
+        slope = (n * float(sum_xy) - float(sum_x) * float(sum_y)) / sxx if sxx > 0 else None
+        stats[postcode] = {"count": int(n), "avg_price": float(avg_price), "monthly_slope": slope}
+    return stats
+
+
 def counts(session: Session) -> dict[str, int]:
     tables: Sequence[tuple[str, type]] = (
         ("listings", Listing),
@@ -105,10 +179,8 @@ def counts(session: Session) -> dict[str, int]:
 def delete_all(session: Session) -> None:
     """Delete all records from all tables (useful for tests)."""
 
-    session.query(Listing).delete()
-    session.query(Transaction).delete()
-    session.query(RentComp).delete()
-    session.query(Rate).delete()
+    for model in (Listing, Transaction, RentComp, Rate):
+        session.execute(delete(model).execution_options(synchronize_session=False))
 
 
 def coerce_date(value: dt.date | str) -> dt.date:
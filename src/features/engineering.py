@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
+from typing import Iterable, Sequence
 
 import numpy as np
-import pandas as pd
 from sqlalchemy.orm import Session
 
 from src.db.models import Listing
-from src.db.repository import latest_rate_value, transactions_for_postcode
+from src.db.repository import latest_rate_value, postcode_stats_bulk
 
 
 @dataclass(slots=True)
@@ -39,6 +40,47 @@ class VacancyHeuristicConfig:
     )
     fallback_rate: float = 0.055
 
+    def sorted_prefixes(self) -> tuple[tuple[str, float], ...]:
+        """Postcode prefix adjustments, longest prefix first.
+
+        Longest prefix wins, so "EC" applies to EC postcodes rather than "E".
+        The ordering is computed once per distinct adjustment table.
+        """
+
+        return _prefixes_longest_first(tuple(self.postcode_prefix_adjustment.items()))
+
+
+@functools.lru_cache(maxsize=16)
+def _prefixes_longest_first(adjustments: tuple[tuple[str, float], ...]) -> tuple[tuple[str, float], ...]:
+    return tuple(sorted(adjustments, key=lambda item: len(item[0]), reverse=True))
+
+
+_DEFAULT_VACANCY_CONFIG = VacancyHeuristicConfig()
+
+
+@dataclass(slots=True)
+class FeatureContext:
+    """Request-scoped memo for the database lookups behind :func:`build_feature_bundle`.
+
+    Share one context across a batch of listings so each postcode's
+    transaction stats and each reference rate are queried once. Create a new
+    context (or call :meth:`clear`) after writing transactions or rates.
+    """
+
+    postcode_stats: dict[str, dict[str, float | None]] = field(default_factory=dict)
+    rates: dict[str, float | None] = field(default_factory=dict)
+
+    def prefetch_postcodes(self, session: Session, postcodes: Iterable[str]) -> None:
+        """Load stats for every uncached postcode in one aggregate query."""
+
+        missing = [postcode for postcode in postcodes if postcode not in self.postcode_stats]
+        if missing:
+            self.postcode_stats.update(postcode_transaction_stats_bulk(session, missing))
+
+    def clear(self) -> None:
+        self.postcode_stats.clear()
+        self.rates.clear()
+
 
 def compute_price_per_sqft(asking_price: float, floor_area_sqft: float | None) -> float | None:
     if floor_area_sqft is None or floor_area_sqft <= 0:
@@ -46,36 +88,38 @@ def compute_price_per_sqft(asking_price: float, floor_area_sqft: float | None) -
     return asking_price / floor_area_sqft
 
 
-def compute_postcode_transaction_stats(session: Session, postcode: str) -> dict[str, float | None]:
-    txns = transactions_for_postcode(session, postcode)
-    if not txns:
-        return {
-            "postcode_avg_transaction_price": None,
-            "postcode_transaction_trend_annual_pct": None,
-            "postcode_transaction_count": 0,
-        }
-
-    df = pd.DataFrame(
-        {
-            "date": [t.date for t in txns],
-            "price_paid": [t.price_paid for t in txns],
+def postcode_transaction_stats_bulk(session: Session, postcodes: Iterable[str]) -> dict[str, dict[str, float | None]]:
+    """Postcode transaction features for many postcodes from a single aggregate query."""
+
+    wanted = list(dict.fromkeys(postcodes))
+    aggregates = postcode_stats_bulk(session, wanted)
+
+    features: dict[str, dict[str, float | None]] = {}
+    for postcode in wanted:
+        agg = aggregates.get(postcode)
+        if agg is None:
+            features[postcode] = {
+                "postcode_avg_transaction_price": None,
+                "postcode_transaction_trend_annual_pct": None,
+                "postcode_transaction_count": 0,
+            }
+            continue
+
+        avg_price = agg["avg_price"]
+        trend_pct = None
+        if agg["count"] >= 3 and agg["monthly_slope"] is not None and avg_price != 0:
+            trend_pct = float((agg["monthly_slope"] * 12) / avg_price)
+
+        features[postcode] = {
+            "postcode_avg_transaction_price": avg_price,
+            "postcode_transaction_trend_annual_pct": trend_pct,
+            "postcode_transaction_count": agg["count"],
         }
-    ).sort_values("date")
+    return features
 
-    avg_price = float(df["price_paid"].mean())
 
-    trend_pct = None
-    if len(df) >= 3:
-        month_index = df["date"].map(lambda d: d.year * 12 + d.month).to_numpy(dtype=float)
-        prices = df["price_paid"].to_numpy(dtype=float)
-        slope, _ = np.polyfit(month_index, prices, deg=1)
-        trend_pct = float((slope * 12) / avg_price) if avg_price != 0 else None
-
-    return {
-        "postcode_avg_transaction_price": avg_price,
-        "postcode_transaction_trend_annual_pct": trend_pct,
-        "postcode_transaction_count": int(len(df)),
-    }
+def compute_postcode_transaction_stats(session: Session, postcode: str) -> dict[str, float | None]:
+    return postcode_transaction_stats_bulk(session, [postcode])[postcode]
 
 
 def compute_yield_estimate(monthly_rent: float, purchase_price: float) -> float | None:
@@ -95,14 +139,14 @@ def estimate_vacancy_rate(
     postcode: str,
     config: VacancyHeuristicConfig | None = None,
 ) -> float:
-    cfg = config or VacancyHeuristicConfig()
+    cfg = config or _DEFAULT_VACANCY_CONFIG
     ptype = (property_type or "").strip().lower()
 
     base = cfg.base_by_property_type.get(ptype, cfg.fallback_rate)
 
     postcode_upper = postcode.upper().replace(" ", "")
     adjustment = 0.0
-    for prefix, value in cfg.postcode_prefix_adjustment.items():
+    for prefix, value in cfg.sorted_prefixes():
         if postcode_upper.startswith(prefix):
             adjustment = value
             break
@@ -116,15 +160,28 @@ def build_feature_bundle(
     market_rent_monthly: float,
     purchase_price: float | None = None,
     reference_rate_name: str = "policy_proxy",
+    context: FeatureContext | None = None,
 ) -> dict[str, float | int | None]:
-    """Return engineered features used by underwriting and UI defaults."""
+    """Return engineered features used by underwriting and UI defaults.
+
+    Pass a shared ``context`` when building bundles for many listings to
+    reuse postcode stats and reference rates already fetched.
+    """
 
     effective_price = purchase_price if purchase_price is not None else listing.asking_price
 
     ppsf = compute_price_per_sqft(listing.asking_price, listing.floor_area_sqft)
-    postcode_stats = compute_postcode_transaction_stats(session, listing.postcode)
+    if context is None:
+        postcode_stats = compute_postcode_transaction_stats(session, listing.postcode)
+        ref_rate = latest_rate_value(session, reference_rate_name)
+    else:
+        if listing.postcode not in context.postcode_stats:
+            context.postcode_stats[listing.postcode] = compute_postcode_transaction_stats(session, listing.postcode)
+        if reference_rate_name not in context.rates:
+            context.rates[reference_rate_name] = latest_rate_value(session, reference_rate_name)
+        postcode_stats = context.postcode_stats[listing.postcode]
+        ref_rate = context.rates[reference_rate_name]
     yield_est = compute_yield_estimate(market_rent_monthly, effective_price)
-    ref_rate = latest_rate_value(session, reference_rate_name)
     spread = compute_yield_spread(yield_est, ref_rate)
     vacancy = estimate_vacancy_rate(listing.property_type, listing.postcode)
 
@@ -136,3 +193,33 @@ def build_feature_bundle(
         "vacancy_heuristic": vacancy,
         **postcode_stats,
     }
+
+
+def build_feature_bundles(
+    session: Session,
+    listings: Sequence[Listing],
+    market_rents_monthly: Sequence[float],
+    reference_rate_name: str = "policy_proxy",
+    context: FeatureContext | None = None,
+) -> list[dict[str, float | int | None]]:
+    """Feature bundles for many listings with two database queries in total.
+
+    Postcode stats for the whole batch come from one aggregate query and the
+    reference rate is read once, so the per-listing work is pure Python.
+    """
+
+    if len(listings) != len(market_rents_monthly):
+        raise ValueError("listings and market_rents_monthly must have the same length")
+
+    ctx = context or FeatureContext()
+    ctx.prefetch_postcodes(session, [listing.postcode for listing in listings])
+    return [
+        build_feature_bundle(
+            session,
+            listing,
+            market_rent_monthly=rent,
+            reference_rate_name=reference_rate_name,
+            context=ctx,
+        )
+        for listing, rent in zip(listings, market_rents_monthly)
+    ]
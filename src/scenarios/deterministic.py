@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import copy
+from dataclasses import replace
 
 import pandas as pd
 
-from src.underwriting.engine import UnderwritingEngine
+from src.underwriting.engine import UnderwritingEngine, UnderwritingResult
 from src.underwriting.models import UnderwritingInputs
 
 
@@ -18,30 +18,45 @@ EXIT_YIELD_EXPANSION_BPS = [25, 50, 100]
 def run_standard_scenarios(
     base_inputs: UnderwritingInputs,
     engine: UnderwritingEngine | None = None,
+    base_result: UnderwritingResult | None = None,
 ) -> pd.DataFrame:
-    """Run requested deterministic stress scenarios and return metric deltas."""
+    """Run requested deterministic stress scenarios and return metric deltas.
+
+    Pass ``base_result`` when the base case has already been run to avoid
+    projecting it a second time.
+    """
 
     model = engine or UnderwritingEngine()
-    base_result = model.run(base_inputs)
+    if base_result is None:
+        base_result = model.run(base_inputs)
     base_metrics = base_result.metrics
 
     rows: list[dict] = []
 
     for bps in RATE_SHOCK_BPS:
-        shocked = copy.deepcopy(base_inputs)
-        shocked.financing.annual_interest_rate += bps / 10_000
+        shocked = replace(
+            base_inputs,
+            financing=replace(
+                base_inputs.financing,
+                annual_interest_rate=base_inputs.financing.annual_interest_rate + bps / 10_000,
+            ),
+        )
         result = model.run(shocked)
         rows.append(_row_from_result(f"Rate shock +{bps}bp", result.metrics, base_metrics))
 
     for pct in RENT_COMPRESSION_PCT:
-        shocked = copy.deepcopy(base_inputs)
-        shocked.rental.market_rent_monthly *= 1 - pct
+        shocked = replace(
+            base_inputs,
+            rental=replace(base_inputs.rental, market_rent_monthly=base_inputs.rental.market_rent_monthly * (1 - pct)),
+        )
         result = model.run(shocked)
         rows.append(_row_from_result(f"Rent compression -{int(pct * 100)}%", result.metrics, base_metrics))
 
     for bps in EXIT_YIELD_EXPANSION_BPS:
-        shocked = copy.deepcopy(base_inputs)
-        shocked.exit.exit_cap_rate += bps / 10_000
+        shocked = replace(
+            base_inputs,
+            exit=replace(base_inputs.exit, exit_cap_rate=base_inputs.exit.exit_cap_rate + bps / 10_000),
+        )
         result = model.run(shocked)
         rows.append(_row_from_result(f"Exit yield expansion +{bps}bp", result.metrics, base_metrics))
 
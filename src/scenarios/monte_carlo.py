@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
-import copy
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
 import pandas as pd
 
+from src.underwriting.cashflows import simulate_levered_cash_flows
 from src.underwriting.engine import UnderwritingEngine
+from src.underwriting.metrics import compute_irr_batch, compute_npv_batch
 from src.underwriting.models import UnderwritingInputs
 
+# Rows projected per pass. Each chunk's temporaries are a few
+# (chunk, hold_months) float arrays: about 4 MB each for a 20-year hold.
+SIMULATION_CHUNK_SIZE = 2_000
+
 
 @dataclass(slots=True)
 class MonteCarloConfig:
@@ -24,77 +29,128 @@ class MonteCarloConfig:
     target_hurdle_irr: float = 0.12
 
 
+def _sign_changes(cf: np.ndarray) -> np.ndarray:
+    """Number of sign changes per row, skipping zero cash flows."""
+
+    signs = np.sign(cf)
+    last_nonzero = np.maximum.accumulate(np.where(signs != 0, np.arange(cf.shape[1]), 0), axis=1)
+    filled = np.take_along_axis(signs, last_nonzero, axis=1)
+    return (filled[:, 1:] * filled[:, :-1] < 0).sum(axis=1)
+
+
+def _batched_irr(
+    cf: np.ndarray,
+    guess: float = 0.1,
+    tol: float = 1e-10,
+    maxiter: int = 50,
+    periods_per_year: int = 12,
+) -> np.ndarray:
+    """Annualized IRR per row of ``cf`` via Newton-Raphson run on all rows in lockstep.
+
+    ``guess`` is an annual rate. Newton is only used where a single sign change
+    guarantees a unique root; other rows, and rows that fail to converge inside
+    the bisection's search range, go through :func:`compute_irr_batch` so the
+    result always matches :func:`compute_irr`.
+    """
+
+    t = np.arange(cf.shape[1])
+    newton = _sign_changes(cf) == 1
+    rate = np.full(cf.shape[0], (1 + guess) ** (1 / periods_per_year) - 1)
+    active = newton.copy()
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        for _ in range(maxiter):
+            rows = np.flatnonzero(active)
+            if rows.size == 0:
+                break
+            discount = (1 + rate[rows, None]) ** -t
+            f = (cf[rows] * discount).sum(axis=1)
+            f_prime = (-t * cf[rows] * discount / (1 + rate[rows, None])).sum(axis=1)
+            step = f / f_prime
+            rate[rows] -= step
+            active[rows[np.abs(step) < tol]] = False
+
+        solved = newton & ~active & (rate > -0.9999) & (rate < 100)
+        irr = np.full(cf.shape[0], np.nan)
+        irr[solved] = (1 + rate[solved]) ** periods_per_year - 1
+
+    if not solved.all():
+        irr[~solved] = compute_irr_batch(cf[~solved], periods_per_year=periods_per_year)
+    return irr
+
+
 def run_monte_carlo(
     base_inputs: UnderwritingInputs,
     config: MonteCarloConfig | None = None,
     engine: UnderwritingEngine | None = None,
 ) -> dict[str, Any]:
-    """Simulate distributions for IRR and NPV under uncertain assumptions."""
+    """Simulate distributions for IRR and NPV under uncertain assumptions.
+
+    Simulations are projected as ``(chunk, months)`` arrays of up to
+    :data:`SIMULATION_CHUNK_SIZE` rows rather than one engine run each;
+    ``engine`` is accepted for backwards compatibility and is not consulted.
+    """
 
     cfg = config or MonteCarloConfig(target_hurdle_irr=base_inputs.target_hurdle_irr)
-    model = engine or UnderwritingEngine()
     rng = np.random.default_rng(cfg.seed)
 
-    records: list[dict] = []
-
-    for i in range(cfg.n_simulations):
-        sim_inputs = copy.deepcopy(base_inputs)
-
-        sim_inputs.rental.annual_rent_growth = float(
-            np.clip(
-                rng.normal(base_inputs.rental.annual_rent_growth, cfg.rent_growth_std),
-                -0.20,
-                0.20,
-            )
+    # One row per simulation, drawn in the same order as sampling each
+    # assumption in turn per simulation, then clipped per column.
+    draws = rng.normal(
+        loc=[
+            base_inputs.rental.annual_rent_growth,
+            base_inputs.rental.vacancy_rate,
+            base_inputs.exit.exit_cap_rate,
+            base_inputs.financing.annual_interest_rate,
+        ],
+        scale=[cfg.rent_growth_std, cfg.vacancy_std, cfg.exit_cap_rate_std, cfg.rate_std],
+        size=(cfg.n_simulations, 4),
+    )
+    draws = np.clip(draws, [-0.20, 0.01, 0.03, 0.00], [0.20, 0.35, 0.20, 0.20])
+    rent_growth, vacancy, exit_cap_rate, interest_rate = draws.T
+
+    # Rows are independent, so chunking bounds memory without changing results.
+    irr = np.empty(cfg.n_simulations)
+    npv = np.empty(cfg.n_simulations)
+    for start in range(0, cfg.n_simulations, SIMULATION_CHUNK_SIZE):
+        chunk = slice(start, start + SIMULATION_CHUNK_SIZE)
+        levered_cf = simulate_levered_cash_flows(
+            base_inputs,
+            annual_rent_growth=rent_growth[chunk],
+            vacancy_rate=vacancy[chunk],
+            exit_cap_rate=exit_cap_rate[chunk],
+            annual_interest_rate=interest_rate[chunk],
         )
-        sim_inputs.rental.vacancy_rate = float(
-            np.clip(
-                rng.normal(base_inputs.rental.vacancy_rate, cfg.vacancy_std),
-                0.01,
-                0.35,
-            )
-        )
-        sim_inputs.exit.exit_cap_rate = float(
-            np.clip(
-                rng.normal(base_inputs.exit.exit_cap_rate, cfg.exit_cap_rate_std),
-                0.03,
-                0.20,
-            )
-        )
-        sim_inputs.financing.annual_interest_rate = float(
-            np.clip(
-                rng.normal(base_inputs.financing.annual_interest_rate, cfg.rate_std),
-                0.00,
-                0.20,
-            )
-        )
-
-        result = model.run(sim_inputs)
-        records.append(
-            {
-                "simulation": i + 1,
-                "irr": result.metrics.get("irr"),
-                "npv": result.metrics.get("npv"),
-                "rent_growth": sim_inputs.rental.annual_rent_growth,
-                "vacancy": sim_inputs.rental.vacancy_rate,
-                "exit_cap_rate": sim_inputs.exit.exit_cap_rate,
-                "interest_rate": sim_inputs.financing.annual_interest_rate,
-            }
-        )
-
-    sims = pd.DataFrame(records)
-    irr_series = sims["irr"].dropna()
-    npv_series = sims["npv"].dropna()
+        irr[chunk] = _batched_irr(levered_cf)
+        npv[chunk] = compute_npv_batch(levered_cf, annual_discount_rate=base_inputs.discount_rate, periods_per_year=12)
+    irr_valid = irr[~np.isnan(irr)]
+    npv_valid = npv[~np.isnan(npv)]
+
+    sims = pd.DataFrame(
+        {
+            "simulation": np.arange(1, cfg.n_simulations + 1),
+            "irr": irr,
+            "npv": npv,
+            "rent_growth": rent_growth,
+            "vacancy": vacancy,
+            "exit_cap_rate": exit_cap_rate,
+            "interest_rate": interest_rate,
+        }
+    )
+    has_irr = irr_valid.size > 0
+    has_npv = npv_valid.size > 0
+    irr_p5, irr_p50, irr_p95 = np.percentile(irr_valid, [5, 50, 95]) if has_irr else (None, None, None)
+    npv_p5, npv_p50, npv_p95 = np.percentile(npv_valid, [5, 50, 95]) if has_npv else (None, None, None)
 
     summary = {
-        "irr_p5": float(np.percentile(irr_series, 5)) if not irr_series.empty else None,
-        "irr_p50": float(np.percentile(irr_series, 50)) if not irr_series.empty else None,
-        "irr_p95": float(np.percentile(irr_series, 95)) if not irr_series.empty else None,
-        "npv_p5": float(np.percentile(npv_series, 5)) if not npv_series.empty else None,
-        "npv_p50": float(np.percentile(npv_series, 50)) if not npv_series.empty else None,
-        "npv_p95": float(np.percentile(npv_series, 95)) if not npv_series.empty else None,
-        "prob_irr_below_zero": float((irr_series < 0).mean()) if not irr_series.empty else None,
-        "prob_irr_below_hurdle": float((irr_series < cfg.target_hurdle_irr).mean()) if not irr_series.empty else None,
+        "irr_p5": float(irr_p5) if has_irr else None,
+        "irr_p50": float(irr_p50) if has_irr else None,
+        "irr_p95": float(irr_p95) if has_irr else None,
+        "npv_p5": float(npv_p5) if has_npv else None,
+        "npv_p50": float(npv_p50) if has_npv else None,
+        "npv_p95": float(npv_p95) if has_npv else None,
+        "prob_irr_below_zero": float((irr_valid < 0).mean()) if has_irr else None,
+        "prob_irr_below_hurdle": float((irr_valid < cfg.target_hurdle_irr).mean()) if has_irr else None,
     }
 
     return {
@@ -7,17 +7,37 @@ import datetime as dt
 import numpy as np
 import pandas as pd
 
-from src.underwriting.debt import build_debt_schedule
-from src.underwriting.models import UnderwritingInputs
+try:
+    import numexpr as ne
+except ImportError:  # pragma: no cover - numexpr is an optional speed-up
+    ne = None
 
+from src.underwriting.debt import amortization_arrays, debt_schedule_arrays
+from src.underwriting.models import UnderwritingInputs, inputs_to_soa
+from src.utils.tax import compute_residential_stamp_duty_vec
 
-def _monthly_growth_rate(annual_growth: float) -> float:
+
+def _monthly_growth_rate(annual_growth: float | np.ndarray) -> float | np.ndarray:
     return (1 + annual_growth) ** (1 / 12.0) - 1
 
 
+def _with_month_zero(value, values: np.ndarray) -> np.ndarray:
+    return np.concatenate(([value], values))
+
+
 def project_cash_flows(inputs: UnderwritingInputs, start_date: dt.date | None = None) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, float]:
     """Project monthly and annual levered cash flows for an investment."""
 
+    monthly, annual, debt_schedule, initial_equity = cash_flow_arrays(inputs, start_date=start_date)
+    return pd.DataFrame(monthly), pd.DataFrame(annual), pd.DataFrame(debt_schedule), initial_equity
+
+
+def cash_flow_arrays(
+    inputs: UnderwritingInputs,
+    start_date: dt.date | None = None,
+) -> tuple[dict[str, np.ndarray], dict[str, np.ndarray], dict[str, np.ndarray], float]:
+    """Columns of :func:`project_cash_flows` as NumPy arrays, without building DataFrames."""
+
     if start_date is None:
         start_date = dt.date.today().replace(day=1)
 
@@ -30,7 +50,7 @@ def project_cash_flows(inputs: UnderwritingInputs, start_date: dt.date | None =
 
     initial_equity = (purchase_price - loan_amount) + acquisition_cost_total + financing_fee
 
-    debt_schedule = build_debt_schedule(
+    debt_schedule = debt_schedule_arrays(
         loan_amount=loan_amount,
         financing=inputs.financing,
         months=hold_months,
@@ -38,122 +58,169 @@ def project_cash_flows(inputs: UnderwritingInputs, start_date: dt.date | None =
     )
 
     growth_m = _monthly_growth_rate(inputs.rental.annual_rent_growth)
-    rows: list[dict] = [
-        {
-            "month": 0,
-            "date": start_date,
-            "gross_rent": 0.0,
-            "vacancy_loss": 0.0,
-            "effective_gross_income": 0.0,
-            "operating_expenses": 0.0,
-            "noi": 0.0,
-            "debt_service": 0.0,
-            "interest": 0.0,
-            "principal": 0.0,
-            "levered_cf": -initial_equity,
-            "exit_proceeds": 0.0,
-            "estimated_value": purchase_price,
-            "loan_balance": loan_amount,
-            "dscr": np.nan,
-            "ltv": loan_amount / purchase_price if purchase_price > 0 else np.nan,
-        }
-    ]
-
-    for month in range(1, hold_months + 1):
-        debt_row = debt_schedule.loc[debt_schedule["month"] == month].iloc[0]
-        gross_rent = inputs.rental.market_rent_monthly * ((1 + growth_m) ** (month - 1))
-        vacancy_loss = gross_rent * inputs.rental.vacancy_rate
-        egi = gross_rent - vacancy_loss
-        opex = egi * inputs.rental.operating_expense_ratio
-        noi = egi - opex
-
-        debt_service = float(debt_row["payment"])
-        interest = float(debt_row["interest"])
-        principal = float(debt_row["principal"])
-        loan_balance = float(debt_row["closing_balance"])
-
-        annualized_noi = noi * 12
-        valuation_cap = inputs.exit.exit_cap_rate if inputs.exit.exit_cap_rate > 0 else 1e-6
-        estimated_value = annualized_noi / valuation_cap
-
-        dscr = noi / debt_service if debt_service > 0 else np.nan
-        ltv = loan_balance / estimated_value if estimated_value > 0 else np.nan
-
-        levered_cf = noi - debt_service
-        exit_proceeds = 0.0
-
-        if month == hold_months:
-            if inputs.exit.exit_multiple is not None:
-                sale_price = annualized_noi * inputs.exit.exit_multiple
-            else:
-                sale_price = estimated_value
-
-            net_sale_before_debt = sale_price * (1 - inputs.exit.sales_cost_pct)
-            equity_sale_proceeds = net_sale_before_debt - loan_balance
-            exit_proceeds = equity_sale_proceeds
-            levered_cf += exit_proceeds
-
-        rows.append(
-            {
-                "month": month,
-                "date": (pd.Timestamp(start_date) + pd.DateOffset(months=month)).date(),
-                "gross_rent": gross_rent,
-                "vacancy_loss": vacancy_loss,
-                "effective_gross_income": egi,
-                "operating_expenses": opex,
-                "noi": noi,
-                "debt_service": debt_service,
-                "interest": interest,
-                "principal": principal,
-                "levered_cf": levered_cf,
-                "exit_proceeds": exit_proceeds,
-                "estimated_value": estimated_value,
-                "loan_balance": loan_balance,
-                "dscr": dscr,
-                "ltv": ltv,
-            }
-        )
-
-    monthly_df = pd.DataFrame(rows)
-
-    operations = monthly_df.loc[monthly_df["month"] > 0].copy()
-    operations["year"] = ((operations["month"] - 1) // 12) + 1
-    annual_df = (
-        operations.groupby("year", as_index=False)[
-            [
-                "gross_rent",
-                "vacancy_loss",
-                "effective_gross_income",
-                "operating_expenses",
-                "noi",
-                "debt_service",
-                "interest",
-                "principal",
-                "levered_cf",
-                "exit_proceeds",
-            ]
-        ]
-        .sum()
-        .sort_values("year")
+    months = np.arange(1, hold_months + 1)
+
+    gross_rent = inputs.rental.market_rent_monthly * (1 + growth_m) ** (months - 1)
+    vacancy_loss = gross_rent * inputs.rental.vacancy_rate
+    egi = gross_rent - vacancy_loss
+    opex = egi * inputs.rental.operating_expense_ratio
+    noi = egi - opex
+
+    debt_service = debt_schedule["payment"]
+    interest = debt_schedule["interest"]
+    principal = debt_schedule["principal"]
+    loan_balance = debt_schedule["closing_balance"]
+
+    annualized_noi = noi * 12
+    valuation_cap = inputs.exit.exit_cap_rate if inputs.exit.exit_cap_rate > 0 else 1e-6
+    estimated_value = annualized_noi / valuation_cap
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dscr = np.where(debt_service > 0, noi / debt_service, np.nan)
+        ltv = np.where(estimated_value > 0, loan_balance / estimated_value, np.nan)
+
+    if inputs.exit.exit_multiple is not None:
+        sale_price = annualized_noi[-1] * inputs.exit.exit_multiple
+    else:
+        sale_price = estimated_value[-1]
+    net_sale_before_debt = sale_price * (1 - inputs.exit.sales_cost_pct)
+    exit_proceeds = np.zeros(hold_months)
+    exit_proceeds[-1] = net_sale_before_debt - loan_balance[-1]
+    levered_cf = noi - debt_service + exit_proceeds
+
+    # Month 0 is the acquisition: equity out, no operations.
+    monthly = {
+        "month": _with_month_zero(0, months),
+        "date": _with_month_zero(start_date, debt_schedule["date"]),
+        "gross_rent": _with_month_zero(0.0, gross_rent),
+        "vacancy_loss": _with_month_zero(0.0, vacancy_loss),
+        "effective_gross_income": _with_month_zero(0.0, egi),
+        "operating_expenses": _with_month_zero(0.0, opex),
+        "noi": _with_month_zero(0.0, noi),
+        "debt_service": _with_month_zero(0.0, debt_service),
+        "interest": _with_month_zero(0.0, interest),
+        "principal": _with_month_zero(0.0, principal),
+        "levered_cf": _with_month_zero(-initial_equity, levered_cf),
+        "exit_proceeds": _with_month_zero(0.0, exit_proceeds),
+        "estimated_value": _with_month_zero(purchase_price, estimated_value),
+        "loan_balance": _with_month_zero(loan_amount, loan_balance),
+        "dscr": _with_month_zero(np.nan, dscr),
+        "ltv": _with_month_zero(loan_amount / purchase_price if purchase_price > 0 else np.nan, ltv),
+    }
+
+    # Hold periods are whole years, so annual totals are row sums over 12-month blocks.
+    annual_columns = {
+        "gross_rent": gross_rent,
+        "vacancy_loss": vacancy_loss,
+        "effective_gross_income": egi,
+        "operating_expenses": opex,
+        "noi": noi,
+        "debt_service": debt_service,
+        "interest": interest,
+        "principal": principal,
+        "levered_cf": levered_cf,
+        "exit_proceeds": exit_proceeds,
+    }
+    annual = {
+        "year": np.arange(inputs.exit.hold_years + 1),
+        **{
+            name: _with_month_zero(
+                -initial_equity if name == "levered_cf" else 0.0,
+                values.reshape(-1, 12).sum(axis=1),
+            )
+            for name, values in annual_columns.items()
+        },
+    }
+
+    return monthly, annual, debt_schedule, initial_equity
+
+
+def simulate_levered_cash_flows(
+    inputs: UnderwritingInputs,
+    annual_rent_growth: np.ndarray,
+    vacancy_rate: np.ndarray,
+    exit_cap_rate: np.ndarray,
+    annual_interest_rate: np.ndarray,
+) -> np.ndarray:
+    """Levered monthly cash flows for many assumption draws at once.
+
+    Each argument array holds one value per simulation and overrides the
+    matching field of ``inputs``. Returns an ``(n_sims, hold_months + 1)``
+    array whose rows equal ``project_cash_flows(...)[0]["levered_cf"]`` for
+    the corresponding overridden inputs.
+    """
+
+    assumptions = np.repeat(inputs_to_soa([inputs]), np.size(annual_rent_growth))
+    assumptions["annual_rent_growth"] = annual_rent_growth
+    assumptions["vacancy_rate"] = vacancy_rate
+    assumptions["exit_cap_rate"] = exit_cap_rate
+    assumptions["annual_interest_rate"] = annual_interest_rate
+    return levered_cash_flow_matrix(assumptions)
+
+
+def levered_cash_flow_matrix(assumptions: np.ndarray) -> np.ndarray:
+    """Levered monthly cash flows for every row of an :func:`inputs_to_soa` array.
+
+    Returns an ``(n_rows, hold_months + 1)`` array whose row ``i`` equals
+    ``project_cash_flows(...)[0]["levered_cf"]`` for the inputs behind row
+    ``i``. The hold period, loan term and amortization style fix the shape
+    of the schedules, so they must be the same on every row.
+    """
+
+    if assumptions.size == 0:
+        raise ValueError("assumptions must contain at least one row")
+    for name in ("hold_years", "term_years", "amortizing"):
+        if np.unique(assumptions[name]).size > 1:
+            raise ValueError(f"{name} must be the same for every row")
+
+    hold_months = int(assumptions["hold_years"][0]) * 12
+    purchase_price = assumptions["purchase_price"]
+
+    loan_amount = purchase_price * assumptions["ltv"]
+    financing_fee = loan_amount * assumptions["financing_fee_pct"]
+    stamp_duty = assumptions["stamp_duty"]
+    estimate_stamp_duty = np.isnan(stamp_duty)
+    if estimate_stamp_duty.any():
+        stamp_duty = np.where(estimate_stamp_duty, compute_residential_stamp_duty_vec(purchase_price), stamp_duty)
+    acquisition_cost_total = stamp_duty + assumptions["legal_fees"] + assumptions["broker_fees"] + assumptions["other_costs"]
+
+    initial_equity = (purchase_price - loan_amount) + acquisition_cost_total + financing_fee
+
+    _, interest, principal, loan_balance = amortization_arrays(
+        loan_amount=loan_amount,
+        monthly_rate=assumptions["annual_interest_rate"] / 12.0,
+        amortizing=bool(assumptions["amortizing"][0]),
+        term_months=int(assumptions["term_years"][0]) * 12,
+        months=hold_months,
     )
 
-    annual_zero = pd.DataFrame(
-        [
-            {
-                "year": 0,
-                "gross_rent": 0.0,
-                "vacancy_loss": 0.0,
-                "effective_gross_income": 0.0,
-                "operating_expenses": 0.0,
-                "noi": 0.0,
-                "debt_service": 0.0,
-                "interest": 0.0,
-                "principal": 0.0,
-                "levered_cf": -initial_equity,
-                "exit_proceeds": 0.0,
-            }
-        ]
+    growth_m = _monthly_growth_rate(assumptions["annual_rent_growth"])[:, None]
+    months = np.arange(1, hold_months + 1, dtype=float)
+
+    # The (n_rows, hold_months) growth grid is the largest temporary here;
+    # numexpr evaluates it in one fused, multithreaded pass when available.
+    if ne is not None:
+        growth_factors = ne.evaluate("(1 + g) ** (k - 1)", local_dict={"g": growth_m, "k": months})
+    else:
+        growth_factors = (1 + growth_m) ** (months - 1)
+    gross_rent = assumptions["market_rent_monthly"][:, None] * growth_factors
+    vacancy_loss = gross_rent * assumptions["vacancy_rate"][:, None]
+    egi = gross_rent - vacancy_loss
+    opex = egi * assumptions["operating_expense_ratio"][:, None]
+    noi = egi - opex
+
+    annualized_noi = noi[:, -1] * 12
+    exit_cap = assumptions["exit_cap_rate"]
+    exit_multiple = assumptions["exit_multiple"]
+    sale_price = np.where(
+        np.isnan(exit_multiple),
+        annualized_noi / np.where(exit_cap > 0, exit_cap, 1e-6),
+        annualized_noi * exit_multiple,
     )
-    annual_df = pd.concat([annual_zero, annual_df], ignore_index=True)
+    net_sale_before_debt = sale_price * (1 - assumptions["sales_cost_pct"])
 
-    return monthly_df, annual_df, debt_schedule, initial_equity
+    levered_cf = np.empty((noi.shape[0], hold_months + 1))
+    levered_cf[:, 0] = -initial_equity
+    levered_cf[:, 1:] = noi - (interest + principal)
+    levered_cf[:, -1] += net_sale_before_debt - loan_balance[:, -1]
+    return levered_cf
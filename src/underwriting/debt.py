@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime as dt
 
+import numpy as np
 import pandas as pd
 
 from src.underwriting.models import FinancingAssumptions
@@ -22,55 +23,97 @@ def build_debt_schedule(
     hold period ends earlier).
     """
 
+    return pd.DataFrame(debt_schedule_arrays(loan_amount, financing, months, start_date))
+
+
+def debt_schedule_arrays(
+    loan_amount: float,
+    financing: FinancingAssumptions,
+    months: int,
+    start_date: dt.date,
+) -> dict[str, np.ndarray]:
+    """Columns of :func:`build_debt_schedule` as NumPy arrays, without building a DataFrame."""
+
     if loan_amount < 0:
         raise ValueError("loan_amount must be non-negative")
     if months <= 0:
         raise ValueError("months must be positive")
 
-    term_months = financing.term_years * 12
-    monthly_rate = financing.annual_interest_rate / 12.0
-    balance = float(loan_amount)
+    opening_balance, interest, principal, closing_balance = amortization_arrays(
+        loan_amount=float(loan_amount),
+        monthly_rate=financing.annual_interest_rate / 12.0,
+        amortizing=financing.amortizing,
+        term_months=financing.term_years * 12,
+        months=months,
+    )
+
+    return {
+        "month": np.arange(1, months + 1),
+        "date": payment_dates(start_date, months),
+        "opening_balance": opening_balance,
+        "interest": interest,
+        "principal": principal,
+        "payment": interest + principal,
+        "closing_balance": closing_balance,
+    }
+
+
+def amortization_arrays(
+    loan_amount: float | np.ndarray,
+    monthly_rate: float | np.ndarray,
+    amortizing: bool,
+    term_months: int,
+    months: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Opening balance, interest, principal and closing balance for months ``1..months``.
 
-    if financing.amortizing and term_months > 0:
-        if monthly_rate == 0:
-            scheduled_payment = balance / term_months
-        else:
-            scheduled_payment = balance * monthly_rate / (1 - (1 + monthly_rate) ** (-term_months))
+    ``loan_amount`` and ``monthly_rate`` may be arrays, in which case every
+    output gains their broadcast shape as leading axes (one schedule per
+    loan/rate pair).
+    """
+
+    rate = np.asarray(monthly_rate, dtype=float)[..., None]
+    loan_amount = np.asarray(loan_amount, dtype=float)[..., None]
+    schedules = np.broadcast_shapes(rate.shape, loan_amount.shape)[:-1]
+
+    # Balance after j payments, j = 0..n, for the months that fall inside the loan term.
+    n = min(months, term_months)
+    j = np.arange(n + 1, dtype=float)
+    if amortizing:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scheduled_payment = loan_amount * rate / (1 - (1 + rate) ** (-term_months))
+            growth = (1 + rate) ** j
+            balances = np.where(
+                rate == 0,
+                loan_amount - (loan_amount / term_months) * j,
+                loan_amount * growth - scheduled_payment * (growth - 1) / rate,
+            )
     else:
-        scheduled_payment = 0.0
-
-    rows: list[dict] = []
-    for month in range(1, months + 1):
-        payment_date = (pd.Timestamp(start_date) + pd.DateOffset(months=month)).date()
-        opening_balance = balance
-
-        interest = 0.0
-        principal = 0.0
-        payment = 0.0
-
-        if month <= term_months and opening_balance > 0:
-            interest = opening_balance * monthly_rate
-            if financing.amortizing:
-                principal = min(scheduled_payment - interest, opening_balance)
-                payment = interest + principal
-            else:
-                # Interest-only coupon, with balloon at contractual maturity.
-                principal = opening_balance if month == term_months else 0.0
-                payment = interest + principal
-
-        closing_balance = max(opening_balance - principal, 0.0)
-        balance = closing_balance
-
-        rows.append(
-            {
-                "month": month,
-                "date": payment_date,
-                "opening_balance": opening_balance,
-                "interest": interest,
-                "principal": principal,
-                "payment": payment,
-                "closing_balance": closing_balance,
-            }
-        )
-
-    return pd.DataFrame(rows)
+        balances = np.broadcast_to(loan_amount, schedules + (n + 1,)).copy()
+    if n == term_months:
+        # Amortizing loans pay off exactly; interest-only loans repay via balloon.
+        balances[..., n] = 0.0
+    balances = np.maximum(balances, 0.0)
+
+    opening_balance = np.repeat(balances[..., n:], months, axis=-1)
+    closing_balance = opening_balance.copy()
+    opening_balance[..., :n] = balances[..., :-1]
+    closing_balance[..., :n] = balances[..., 1:]
+
+    interest = np.zeros_like(opening_balance)
+    interest[..., :n] = opening_balance[..., :n] * rate
+    principal = opening_balance - closing_balance
+    return opening_balance, interest, principal, closing_balance
+
+
+def payment_dates(start_date: dt.date, months: int) -> np.ndarray:
+    """Dates ``1..months`` calendar months after ``start_date``, clamped to month end.
+
+    Matches ``start_date + pd.DateOffset(months=k)`` without a per-month loop.
+    """
+
+    month_starts = np.datetime64(start_date, "M") + np.arange(1, months + 1)
+    first_days = month_starts.astype("datetime64[D]")
+    month_lengths = ((month_starts + 1).astype("datetime64[D]") - first_days).astype(int)
+    day_offsets = np.minimum(start_date.day, month_lengths) - 1
+    return (first_days + day_offsets).astype(object)
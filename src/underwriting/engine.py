@@ -3,63 +3,115 @@
 from __future__ import annotations
 
 import datetime as dt
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field, replace
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
-from src.underwriting.cashflows import project_cash_flows
+from src.underwriting.cashflows import cash_flow_arrays
 from src.underwriting.metrics import summarize_metrics
 from src.underwriting.models import UnderwritingInputs
 
 
 @dataclass(slots=True)
 class UnderwritingResult:
-    monthly_cash_flows: pd.DataFrame
-    annual_cash_flows: pd.DataFrame
-    debt_schedule: pd.DataFrame
+    """Metrics plus the projected schedules.
+
+    Schedules are held as column arrays and only turned into DataFrames the
+    first time each one is read, so callers that need just ``metrics`` (such
+    as scenario sweeps) never pay for pandas construction.
+    """
+
+    monthly_columns: dict[str, np.ndarray]
+    annual_columns: dict[str, np.ndarray]
+    debt_columns: dict[str, np.ndarray]
     metrics: dict[str, float | None]
     assumptions: UnderwritingInputs
+    _frames: dict[str, pd.DataFrame] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _frame(self, name: str, columns: dict[str, np.ndarray]) -> pd.DataFrame:
+        if name not in self._frames:
+            self._frames[name] = pd.DataFrame(columns)
+        return self._frames[name]
+
+    @property
+    def monthly_cash_flows(self) -> pd.DataFrame:
+        return self._frame("monthly", self.monthly_columns)
+
+    @property
+    def annual_cash_flows(self) -> pd.DataFrame:
+        return self._frame("annual", self.annual_columns)
+
+    @property
+    def debt_schedule(self) -> pd.DataFrame:
+        return self._frame("debt", self.debt_columns)
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize result into a JSON-friendly structure."""
 
-        def _records(df: pd.DataFrame) -> list[dict[str, Any]]:
-            payload: list[dict[str, Any]] = []
-            for row in df.to_dict(orient="records"):
-                converted: dict[str, Any] = {}
-                for key, value in row.items():
-                    if isinstance(value, dt.date):
-                        converted[key] = value.isoformat()
-                    elif pd.isna(value):
-                        converted[key] = None
-                    else:
-                        converted[key] = value
-                payload.append(converted)
-            return payload
+        def _column_values(values: np.ndarray) -> list[Any]:
+            if values.dtype.kind == "f":
+                converted = values.astype(object)
+                converted[np.isnan(values)] = None
+                return converted.tolist()
+            if values.dtype.kind == "O":
+                return [value.isoformat() if isinstance(value, dt.date) else value for value in values]
+            return values.tolist()
+
+        def _records(columns: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+            # Convert column by column, then zip into rows, instead of checking every cell.
+            keys = list(columns)
+            converted = [_column_values(np.asarray(values)) for values in columns.values()]
+            return [dict(zip(keys, row)) for row in zip(*converted)]
 
         return {
             "metrics": self.metrics,
-            "monthly_cash_flows": _records(self.monthly_cash_flows),
-            "annual_cash_flows": _records(self.annual_cash_flows),
-            "debt_schedule": _records(self.debt_schedule),
+            "monthly_cash_flows": _records(self.monthly_columns),
+            "annual_cash_flows": _records(self.annual_columns),
+            "debt_schedule": _records(self.debt_columns),
         }
 
 
 class UnderwritingEngine:
-    """Runs cash flow projection + metric computation."""
+    """Runs cash flow projection + metric computation.
+
+    Projections are memoized per engine on the (frozen, hashable) inputs and
+    start date. Each call returns its own :class:`UnderwritingResult` with
+    fresh ``metrics`` and column dicts, so callers cannot change each other's
+    results; the column arrays themselves are shared and read-only.
+    """
+
+    def __init__(self, cache_size: int = 64) -> None:
+        self._run_cached = functools.lru_cache(maxsize=cache_size)(self._run)
 
     def run(self, inputs: UnderwritingInputs, start_date: dt.date | None = None) -> UnderwritingResult:
-        monthly_df, annual_df, debt_df, _ = project_cash_flows(inputs, start_date=start_date)
+        if start_date is None:
+            start_date = dt.date.today().replace(day=1)
+        cached = self._run_cached(inputs, start_date)
+        return replace(
+            cached,
+            monthly_columns=dict(cached.monthly_columns),
+            annual_columns=dict(cached.annual_columns),
+            debt_columns=dict(cached.debt_columns),
+            metrics=dict(cached.metrics),
+        )
+
+    def _run(self, inputs: UnderwritingInputs, start_date: dt.date) -> UnderwritingResult:
+        monthly, annual, debt, _ = cash_flow_arrays(inputs, start_date=start_date)
+        for columns in (monthly, annual, debt):
+            for values in columns.values():
+                values.setflags(write=False)
         metrics = summarize_metrics(
-            monthly_cash_flows=monthly_df,
-            annual_cash_flows=annual_df,
+            monthly_cash_flows=monthly,
+            annual_cash_flows=annual,
             annual_discount_rate=inputs.discount_rate,
         )
         return UnderwritingResult(
-            monthly_cash_flows=monthly_df,
-            annual_cash_flows=annual_df,
-            debt_schedule=debt_df,
+            monthly_columns=monthly,
+            annual_columns=annual,
+            debt_columns=debt,
             metrics=metrics,
             assumptions=inputs,
         )
@@ -2,113 +2,379 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import functools
+from typing import Iterable, Mapping
 
 import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is an optional speed-up
+    njit = None
+
+
+def _as_float_array(cash_flows: Iterable[float]) -> np.ndarray:
+    # Arrays pass through without a copy; other iterables are read once.
+    if isinstance(cash_flows, np.ndarray):
+        return np.ascontiguousarray(cash_flows, dtype=np.float64)
+    return np.fromiter(cash_flows, dtype=np.float64)
+
 
 def compute_npv(cash_flows: Iterable[float], annual_discount_rate: float, periods_per_year: int = 12) -> float:
-    """Compute NPV with a user-defined annual discount rate."""
+    """Compute NPV with a user-defined annual discount rate.
 
-    cfs = list(cash_flows)
+    Evaluated as a polynomial in the discount factor ``1 / (1 + r)`` with
+    Horner's rule, so no per-period powers are taken.
+    """
+
+    cfs = _as_float_array(cash_flows)
     if periods_per_year <= 0:
         raise ValueError("periods_per_year must be positive")
+    if cfs.size == 0:
+        return 0.0
 
     periodic_rate = (1 + annual_discount_rate) ** (1 / periods_per_year) - 1
-    return float(sum(cf / ((1 + periodic_rate) ** t) for t, cf in enumerate(cfs)))
+    return float(np.polynomial.polynomial.polyval(1.0 / (1.0 + periodic_rate), cfs))
 
 
-def _npv_at_rate(cash_flows: list[float], rate: float) -> float:
-    return float(sum(cf / ((1 + rate) ** t) for t, cf in enumerate(cash_flows)))
+def _npv_at_rate(cash_flows, rate: float) -> float:
+    # Horner's rule in 1 / (1 + rate); runs on lists, or on arrays under Numba.
+    npv = 0.0
+    growth = 1.0 + rate
+    for i in range(len(cash_flows) - 1, -1, -1):
+        npv = npv / growth + cash_flows[i]
+    return npv
 
 
-def compute_irr(
-    cash_flows: Iterable[float],
-    periods_per_year: int = 12,
-    tol: float = 1e-7,
-    max_iter: int = 200,
-) -> float | None:
-    """Compute IRR robustly using bounded bisection.
+def _npv_and_slope(cash_flows, rate: float) -> tuple[float, float]:
+    # One Horner pass for p(x) and p'(x) with x = 1 / (1 + rate); dNPV/drate = -x**2 * p'(x).
+    x = 1.0 / (1.0 + rate)
+    npv = 0.0
+    dnpv_dx = 0.0
+    for i in range(len(cash_flows) - 1, -1, -1):
+        dnpv_dx = dnpv_dx * x + npv
+        npv = npv * x + cash_flows[i]
+    return npv, -x * x * dnpv_dx
 
-    Returns ``None`` when cash flows do not bracket a valid root or when the
-    solver cannot converge within the specified iterations.
+
+def _bit_midpoint(low: float, high: float) -> float:
+    """Rate halfway between ``low`` and ``high`` in the bit patterns of ``1 + rate``.
+
+    ``1 + rate`` is positive, so its IEEE-754 bits order like the values and
+    each halving in bit space removes half of the representable rates left in
+    the bracket: any bracket shrinks to adjacent floats within 64 steps. Returns
+    ``low`` or ``high`` once they are adjacent.
     """
 
-    cfs = [float(cf) for cf in cash_flows]
-    if not cfs or periods_per_year <= 0:
-        return None
-    if all(cf >= 0 for cf in cfs) or all(cf <= 0 for cf in cfs):
-        return None
+    bounds = np.empty(2)
+    bounds[0] = 1.0 + low
+    bounds[1] = 1.0 + high
+    bits = bounds.view(np.int64)
+    mid = np.empty(1, dtype=np.int64)
+    mid[0] = bits[0] + (bits[1] - bits[0]) // 2
+    return float(mid.view(np.float64)[0]) - 1.0
+
+
+def _irr_periodic(cash_flows, tol: float, max_iter: int) -> float:
+    """Periodic IRR by bracket expansion then safeguarded Newton, or NaN when there is none.
+
+    Each iteration narrows the sign-change bracket and takes a Newton step,
+    falling back to bit-space bisection whenever the step would leave it or
+    stops converging quickly. A bracket that can no longer be split pins the
+    root to one ulp and is returned even if ``abs(npv) >= tol``.
+    """
 
     low = -0.9999
     high = 1.0
-    f_low = _npv_at_rate(cfs, low)
-    f_high = _npv_at_rate(cfs, high)
+    f_low = _npv_at_rate(cash_flows, low)
+    f_high = _npv_at_rate(cash_flows, high)
 
     # Expand the upper bound until the sign flips or the bound is implausibly high.
     expansion_count = 0
     while f_low * f_high > 0 and high < 100 and expansion_count < 25:
         high *= 2
-        f_high = _npv_at_rate(cfs, high)
+        f_high = _npv_at_rate(cash_flows, high)
         expansion_count += 1
 
     if f_low * f_high > 0:
-        return None
+        return np.nan
 
+    rate = (low + high) / 2
+    width = high - low
     for _ in range(max_iter):
-        mid = (low + high) / 2
-        f_mid = _npv_at_rate(cfs, mid)
-        if abs(f_mid) < tol:
-            return float((1 + mid) ** periods_per_year - 1)
-        if f_low * f_mid <= 0:
-            high = mid
-            f_high = f_mid
+        f, slope = _npv_and_slope(cash_flows, rate)
+        if abs(f) < tol:
+            return rate
+        if f_low * f <= 0:
+            high = rate
         else:
-            low = mid
-            f_low = f_mid
+            low = rate
+            f_low = f
+
+        # Bisect when Newton would leave the bracket or is not at least halving the step.
+        newton = rate - f / slope if slope != 0 else np.nan
+        if low < newton < high and 2 * abs(newton - rate) <= width:
+            width = abs(newton - rate)
+            rate = newton
+        else:
+            width = high - low
+            rate = _bit_midpoint(low, high)
+            if rate <= low or rate >= high:
+                return rate
+
+    return np.nan
+
+
+def _irr_periodic_rows(cash_flows: np.ndarray, tol: float, max_iter: int) -> np.ndarray:
+    # One scalar solve per row, in a serial loop: a parallel kernel would start
+    # Numba's threading layer from whichever thread calls it (Streamlit runs
+    # scripts off the main thread), which can hang interpreter shutdown.
+    rates = np.empty(cash_flows.shape[0])
+    for i in range(cash_flows.shape[0]):
+        row = cash_flows[i]
+        if row.min() < 0 and row.max() > 0:
+            rates[i] = _irr_periodic(row, tol, max_iter)
+        else:
+            rates[i] = np.nan
+    return rates
+
+
+if njit is not None:
+    _npv_at_rate = njit(cache=True)(_npv_at_rate)
+    _npv_and_slope = njit(cache=True)(_npv_and_slope)
+    _bit_midpoint = njit(cache=True)(_bit_midpoint)
+    _irr_periodic = njit(cache=True)(_irr_periodic)
+    _irr_periodic_rows = njit(cache=True)(_irr_periodic_rows)
+
+
+def compute_irr(
+    cash_flows: Iterable[float],
+    periods_per_year: int = 12,
+    tol: float = 1e-7,
+    max_iter: int = 200,
+) -> float | None:
+    """Compute IRR robustly using a bracketed, bisection-safeguarded Newton solver.
+
+    Returns ``None`` when cash flows do not bracket a valid root or when the
+    solver cannot converge within the specified iterations. The solver loop
+    is compiled with Numba when it is installed.
+    """
+
+    cfs = _as_float_array(cash_flows)
+    if cfs.size == 0 or periods_per_year <= 0:
+        return None
+    if not cfs.min() < 0 < cfs.max():
+        return None
 
-    return None
+    rate = _irr_periodic_cached(cfs.tobytes(), tol, max_iter)
+    if np.isnan(rate):
+        return None
+    return float((1 + rate) ** periods_per_year - 1)
+
+
+@functools.lru_cache(maxsize=1024)
+def _irr_periodic_cached(cash_flow_bytes: bytes, tol: float, max_iter: int) -> float:
+    # Keyed on the exact float64 bytes, so sensitivity grids that repeat a
+    # cash flow stream (zero-delta shocks, reruns) skip the solve.
+    cfs = np.frombuffer(cash_flow_bytes, dtype=np.float64)
+    # Numba reads the float64 buffer directly; interpreted Horner loops run
+    # fastest over a list, so the pure-Python path gets one built once.
+    return _irr_periodic(cfs if njit is not None else cfs.tolist(), tol, max_iter)
+
+
+@functools.lru_cache(maxsize=32)
+def _compounding_factors(periodic_rate: float, periods: int) -> np.ndarray:
+    """Read-only ``(1 + periodic_rate) ** t`` for ``t = 0..periods-1``, shared across calls."""
+
+    factors = (1 + periodic_rate) ** np.arange(periods)
+    factors.setflags(write=False)
+    return factors
+
+
+def compute_npv_batch(cash_flows: np.ndarray, annual_discount_rate: float, periods_per_year: int = 12) -> np.ndarray:
+    """Row-wise :func:`compute_npv` for a 2-D array of cash flow paths."""
+
+    if periods_per_year <= 0:
+        raise ValueError("periods_per_year must be positive")
+
+    cfs = np.asarray(cash_flows, dtype=float)
+    periodic_rate = (1 + annual_discount_rate) ** (1 / periods_per_year) - 1
+    return (cfs / _compounding_factors(periodic_rate, cfs.shape[1])).sum(axis=1)
+
+
+def _npv_rows(cash_flows: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    # Row-wise _npv_at_rate, step for step: Horner's rule never forms (1 + rate) ** t,
+    # which overflows near rate = -1 on long holds and turns the sums into NaN.
+    npv = np.zeros(cash_flows.shape[0])
+    growth = 1.0 + rates
+    for i in range(cash_flows.shape[1] - 1, -1, -1):
+        npv = npv / growth + cash_flows[:, i]
+    return npv
+
+
+def _npv_and_slope_rows(cash_flows: np.ndarray, rates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # Row-wise _npv_and_slope, step for step.
+    x = 1.0 / (1.0 + rates)
+    npv = np.zeros(cash_flows.shape[0])
+    dnpv_dx = np.zeros(cash_flows.shape[0])
+    for i in range(cash_flows.shape[1] - 1, -1, -1):
+        dnpv_dx = dnpv_dx * x + npv
+        npv = npv * x + cash_flows[:, i]
+    return npv, -x * x * dnpv_dx
+
+
+def compute_irr_batch(
+    cash_flows: np.ndarray,
+    periods_per_year: int = 12,
+    tol: float = 1e-7,
+    max_iter: int = 200,
+) -> np.ndarray:
+    """Row-wise :func:`compute_irr` for a 2-D array of cash flow paths.
+
+    Rows without an IRR are ``NaN``. With Numba installed each row runs the
+    compiled scalar solver inside one serial compiled loop. Otherwise the same
+    bracketing, safeguarded Newton and bit-space bisection run on every row
+    at once in NumPy, with the same Horner evaluations as the scalar solver.
+    Rows whose bracket ends or iterates are not finite (NPVs that overflow
+    near ``rate = -1`` on long holds) are solved one at a time by
+    :func:`compute_irr` instead.
+    """
+
+    cfs = np.asarray(cash_flows, dtype=float)
+    irr = np.full(cfs.shape[0], np.nan)
+    if cfs.shape[1] == 0 or periods_per_year <= 0:
+        return irr
+    if njit is not None:
+        return (1 + _irr_periodic_rows(np.ascontiguousarray(cfs), tol, max_iter)) ** periods_per_year - 1
+
+    active = (cfs.min(axis=1) < 0) & (cfs.max(axis=1) > 0)
+    low = np.full(cfs.shape[0], -0.9999)
+    high = np.full(cfs.shape[0], 1.0)
+
+    with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+        f_low = _npv_rows(cfs, low)
+        f_high = _npv_rows(cfs, high)
+
+        for _ in range(25):
+            expand = active & (f_low * f_high > 0) & (high < 100)
+            if not expand.any():
+                break
+            high[expand] *= 2
+            f_high[expand] = _npv_rows(cfs[expand], high[expand])
+        active &= ~(f_low * f_high > 0)
+        # Only finite sign changes are solved here; a midpoint pinned between
+        # overflowed ends says nothing about the root.
+        scalar_rows = active & ~(np.isfinite(f_low) & np.isfinite(f_high))
+        active &= ~scalar_rows
+
+        rate = (low + high) / 2
+        width = high - low
+        for _ in range(max_iter):
+            rows = np.flatnonzero(active)
+            if rows.size == 0:
+                break
+            f, slope = _npv_and_slope_rows(cfs[rows], rate[rows])
+            diverged = ~np.isfinite(f)
+            if diverged.any():
+                scalar_rows[rows[diverged]] = True
+                active[rows[diverged]] = False
+                rows, f, slope = rows[~diverged], f[~diverged], slope[~diverged]
+
+            converged = np.abs(f) < tol
+            irr[rows[converged]] = (1 + rate[rows[converged]]) ** periods_per_year - 1
+            active[rows[converged]] = False
+
+            move_high = ~converged & (f_low[rows] * f <= 0)
+            move_low = ~converged & ~move_high
+            high[rows[move_high]] = rate[rows[move_high]]
+            low[rows[move_low]] = rate[rows[move_low]]
+            f_low[rows[move_low]] = f[move_low]
+
+            newton = rate[rows] - f / slope
+            step = np.abs(newton - rate[rows])
+            use_newton = (low[rows] < newton) & (newton < high[rows]) & (2 * step <= width[rows])
+            low_bits = (1.0 + low[rows]).view(np.int64)
+            high_bits = (1.0 + high[rows]).view(np.int64)
+            midpoint = (low_bits + (high_bits - low_bits) // 2).view(np.float64) - 1.0
+            width[rows] = np.where(use_newton, step, high[rows] - low[rows])
+            rate[rows] = np.where(use_newton, newton, midpoint)
+
+            collapsed = ~converged & ~use_newton & ((midpoint <= low[rows]) | (midpoint >= high[rows]))
+            irr[rows[collapsed]] = (1 + midpoint[collapsed]) ** periods_per_year - 1
+            active[rows[collapsed]] = False
+
+    for i in np.flatnonzero(scalar_rows):
+        row_irr = compute_irr(cfs[i], periods_per_year=periods_per_year, tol=tol, max_iter=max_iter)
+        irr[i] = np.nan if row_irr is None else row_irr
+    return irr
 
 
 def equity_multiple(cash_flows: Iterable[float]) -> float | None:
-    cfs = [float(cf) for cf in cash_flows]
-    invested = -sum(cf for cf in cfs if cf < 0)
-    returned = sum(cf for cf in cfs if cf > 0)
+    cfs = _as_float_array(cash_flows)
+    invested = -float(np.minimum(cfs, 0.0).sum())
+    returned = float(np.maximum(cfs, 0.0).sum())
     if invested <= 0:
         return None
     return returned / invested
 
 
+def equity_multiple_batch(cash_flows: np.ndarray) -> np.ndarray:
+    """Row-wise :func:`equity_multiple`; rows with no equity invested are ``NaN``."""
+
+    cfs = np.asarray(cash_flows, dtype=float)
+    invested = -np.minimum(cfs, 0.0).sum(axis=1)
+    returned = np.maximum(cfs, 0.0).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(invested > 0, returned / invested, np.nan)
+
+
 def cash_on_cash(year_one_cash_flow: float, initial_equity: float) -> float | None:
     if initial_equity <= 0:
         return None
     return year_one_cash_flow / initial_equity
 
 
+def _value_at(keys: np.ndarray, values: np.ndarray, key: int) -> float:
+    # Schedules number consecutive periods from keys[0], so the row is known
+    # up front; a binary search covers any other ascending key column.
+    if keys.size == 0:
+        return 0.0
+    position = int(key - keys[0])
+    if not (0 <= position < keys.size and keys[position] == key):
+        position = int(np.searchsorted(keys, key))
+    if position < keys.size and keys[position] == key:
+        return float(values[position])
+    return 0.0
+
+
 def summarize_metrics(
-    monthly_cash_flows: pd.DataFrame,
-    annual_cash_flows: pd.DataFrame,
+    monthly_cash_flows: pd.DataFrame | Mapping[str, np.ndarray],
+    annual_cash_flows: pd.DataFrame | Mapping[str, np.ndarray],
     annual_discount_rate: float,
 ) -> dict[str, float | None]:
-    cfs = monthly_cash_flows["levered_cf"].tolist()
-    irr = compute_irr(cfs, periods_per_year=12)
-    npv = compute_npv(cfs, annual_discount_rate=annual_discount_rate, periods_per_year=12)
-    em = equity_multiple(cfs)
-
-    initial_equity = abs(float(monthly_cash_flows.loc[monthly_cash_flows["month"] == 0, "levered_cf"].sum()))
-    year_one_cf = float(
-        annual_cash_flows.loc[annual_cash_flows["year"] == 1, "levered_cf"].sum()
-        if 1 in annual_cash_flows["year"].values
-        else 0.0
-    )
+    """Headline metrics from monthly and annual cash flow columns.
+
+    Accepts the DataFrames from ``project_cash_flows`` or the column dicts
+    from ``cash_flow_arrays``.
+    """
+
+    levered_cf = np.asarray(monthly_cash_flows["levered_cf"], dtype=float)
+    irr = compute_irr(levered_cf, periods_per_year=12)
+    npv = compute_npv(levered_cf, annual_discount_rate=annual_discount_rate, periods_per_year=12)
+    em = equity_multiple(levered_cf)
+
+    initial_equity = abs(_value_at(np.asarray(monthly_cash_flows["month"]), levered_cf, 0))
+    year_one_cf = _value_at(np.asarray(annual_cash_flows["year"]), np.asarray(annual_cash_flows["levered_cf"]), 1)
     coc = cash_on_cash(year_one_cf, initial_equity)
 
-    dscr_series = monthly_cash_flows["dscr"].dropna()
-    min_dscr = float(dscr_series.min()) if not dscr_series.empty else None
+    dscr = np.asarray(monthly_cash_flows["dscr"], dtype=float)
+    dscr = dscr[~np.isnan(dscr)]
+    min_dscr = float(dscr.min()) if dscr.size else None
 
-    ltv_series = monthly_cash_flows["ltv"].dropna()
-    max_ltv = float(ltv_series.max()) if not ltv_series.empty else None
+    ltv = np.asarray(monthly_cash_flows["ltv"], dtype=float)
+    ltv = ltv[~np.isnan(ltv)]
+    max_ltv = float(ltv.max()) if ltv.size else None
 
     return {
         "irr": irr,
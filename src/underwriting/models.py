@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from typing import Any, Sequence
+
+import numpy as np
 
 from src.utils.tax import compute_residential_stamp_duty
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AcquisitionCosts:
     """Acquisition cost assumptions.
 
@@ -20,17 +23,20 @@ class AcquisitionCosts:
     broker_fees: float = 0.0
     other_costs: float = 0.0
 
+    def __post_init__(self) -> None:
+        if self.stamp_duty is not None and self.stamp_duty < 0:
+            raise ValueError("Acquisition cost components must be non-negative")
+        if self.legal_fees < 0 or self.broker_fees < 0 or self.other_costs < 0:
+            raise ValueError("Acquisition cost components must be non-negative")
+
     def total(self, purchase_price: float) -> float:
         stamp = self.stamp_duty
         if stamp is None:
             stamp = compute_residential_stamp_duty(purchase_price)
-        components = [stamp, self.legal_fees, self.broker_fees, self.other_costs]
-        if any(value < 0 for value in components):
-            raise ValueError("Acquisition cost components must be non-negative")
-        return float(sum(components))
+        return float(stamp + self.legal_fees + self.broker_fees + self.other_costs)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RentalAssumptions:
     market_rent_monthly: float
     annual_rent_growth: float = 0.02
@@ -48,7 +54,7 @@ class RentalAssumptions:
             raise ValueError("operating_expense_ratio must be between 0 and 0.95")
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class FinancingAssumptions:
     ltv: float = 0.75
     annual_interest_rate: float = 0.05
@@ -67,7 +73,7 @@ class FinancingAssumptions:
             raise ValueError("financing_fee_pct must be between 0 and 0.10")
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ExitAssumptions:
     hold_years: int = 5
     exit_cap_rate: float = 0.06
@@ -85,7 +91,7 @@ class ExitAssumptions:
             raise ValueError("sales_cost_pct must be between 0 and 0.20")
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class UnderwritingInputs:
     purchase_price: float
     acquisition_costs: AcquisitionCosts = field(default_factory=AcquisitionCosts)
@@ -102,3 +108,90 @@ class UnderwritingInputs:
             raise ValueError("discount_rate out of bounds")
         if not -0.50 <= self.target_hurdle_irr <= 1.0:
             raise ValueError("target_hurdle_irr out of bounds")
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-friendly nested dict of all assumptions."""
+
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> UnderwritingInputs:
+        """Rebuild inputs from the structure produced by :meth:`to_dict`."""
+
+        return cls(
+            purchase_price=payload["purchase_price"],
+            acquisition_costs=AcquisitionCosts(**payload["acquisition_costs"]),
+            rental=RentalAssumptions(**payload["rental"]),
+            financing=FinancingAssumptions(**payload["financing"]),
+            exit=ExitAssumptions(**payload["exit"]),
+            discount_rate=payload["discount_rate"],
+            target_hurdle_irr=payload["target_hurdle_irr"],
+        )
+
+
+# One row per set of inputs, one column per scalar assumption. Optional
+# amounts (``stamp_duty``, ``exit_multiple``) are NaN when unset.
+ASSUMPTION_DTYPE = np.dtype(
+    [
+        ("purchase_price", "f8"),
+        ("stamp_duty", "f8"),
+        ("legal_fees", "f8"),
+        ("broker_fees", "f8"),
+        ("other_costs", "f8"),
+        ("market_rent_monthly", "f8"),
+        ("annual_rent_growth", "f8"),
+        ("vacancy_rate", "f8"),
+        ("operating_expense_ratio", "f8"),
+        ("ltv", "f8"),
+        ("annual_interest_rate", "f8"),
+        ("amortizing", "?"),
+        ("term_years", "i8"),
+        ("financing_fee_pct", "f8"),
+        ("hold_years", "i8"),
+        ("exit_cap_rate", "f8"),
+        ("exit_multiple", "f8"),
+        ("sales_cost_pct", "f8"),
+        ("discount_rate", "f8"),
+        ("target_hurdle_irr", "f8"),
+    ]
+)
+
+
+def inputs_to_soa(inputs: Sequence[UnderwritingInputs]) -> np.ndarray:
+    """Flatten inputs into a structured array with :data:`ASSUMPTION_DTYPE`.
+
+    Batch projections read whole columns (``soa["ltv"]``) instead of walking
+    one dataclass tree per simulation.
+    """
+
+    def _or_nan(value: float | None) -> float:
+        return np.nan if value is None else value
+
+    return np.array(
+        [
+            (
+                item.purchase_price,
+                _or_nan(item.acquisition_costs.stamp_duty),
+                item.acquisition_costs.legal_fees,
+                item.acquisition_costs.broker_fees,
+                item.acquisition_costs.other_costs,
+                item.rental.market_rent_monthly,
+                item.rental.annual_rent_growth,
+                item.rental.vacancy_rate,
+                item.rental.operating_expense_ratio,
+                item.financing.ltv,
+                item.financing.annual_interest_rate,
+                item.financing.amortizing,
+                item.financing.term_years,
+                item.financing.financing_fee_pct,
+                item.exit.hold_years,
+                item.exit.exit_cap_rate,
+                _or_nan(item.exit.exit_multiple),
+                item.exit.sales_cost_pct,
+                item.discount_rate,
+                item.target_hurdle_irr,
+            )
+            for item in inputs
+        ],
+        dtype=ASSUMPTION_DTYPE,
+    )
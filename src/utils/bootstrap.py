@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 from sqlalchemy.engine import Engine
@@ -23,42 +24,52 @@ from src.utils.config import (
 
 def bootstrap_database(
     engine: Engine,
-    listings_path: str | Path | None = None,
-    transactions_path: str | Path | None = None,
-    rates_path: str | Path | None = None,
-    rent_comps_path: str | Path | None = None,
+    listings_path: str | os.PathLike[str] | None = None,
+    transactions_path: str | os.PathLike[str] | None = None,
+    rates_path: str | os.PathLike[str] | None = None,
+    rent_comps_path: str | os.PathLike[str] | None = None,
 ) -> dict[str, int]:
     """Create tables and load sample datasets if tables are empty."""
 
     init_db(engine)
     session_factory = get_session_factory(engine)
 
-    resolved_paths = {
-        "listings": Path(listings_path) if listings_path else SAMPLE_LISTINGS_PATH,
-        "transactions": Path(transactions_path) if transactions_path else SAMPLE_TRANSACTIONS_PATH,
-        "rates": Path(rates_path) if rates_path else SAMPLE_RATES_PATH,
-        "rent_comps": Path(rent_comps_path) if rent_comps_path else SAMPLE_RENT_COMPS_PATH,
-    }
-
     inserted = {"listings": 0, "transactions": 0, "rates": 0, "rent_comps": 0}
 
     with session_scope(session_factory) as session:
         table_counts = counts(session)
+    if all(table_counts[name] > 0 for name in inserted):
+        return inserted
 
-        if table_counts["listings"] == 0 and resolved_paths["listings"].exists():
-            listings = MockListingsAdapter(resolved_paths["listings"]).fetch_listings()
-            inserted["listings"] = add_listings(session, listings)
+    # Paths are only resolved and checked for tables that still need loading.
+    with session_scope(session_factory) as session:
+        if table_counts["listings"] == 0:
+            path = _existing_path(listings_path, SAMPLE_LISTINGS_PATH)
+            if path is not None:
+                inserted["listings"] = add_listings(session, MockListingsAdapter(path).fetch_listings())
 
-        if table_counts["transactions"] == 0 and resolved_paths["transactions"].exists():
-            inserted["transactions"] = LandRegistryCSVIngestor().ingest(session, resolved_paths["transactions"])
+        if table_counts["transactions"] == 0:
+            path = _existing_path(transactions_path, SAMPLE_TRANSACTIONS_PATH)
+            if path is not None:
+                inserted["transactions"] = LandRegistryCSVIngestor().ingest(session, path)
 
         if table_counts["rates"] == 0:
-            rates = RatesSeriesAdapter().load(
-                resolved_paths["rates"] if resolved_paths["rates"].exists() else None
-            )
+            rates = RatesSeriesAdapter().load(_existing_path(rates_path, SAMPLE_RATES_PATH))
             inserted["rates"] = add_rates(session, rates)
 
-        if table_counts["rent_comps"] == 0 and resolved_paths["rent_comps"].exists():
-            inserted["rent_comps"] = RentCompsCSVIngestor().ingest(session, resolved_paths["rent_comps"])
+        if table_counts["rent_comps"] == 0:
+            path = _existing_path(rent_comps_path, SAMPLE_RENT_COMPS_PATH)
+            if path is not None:
+                inserted["rent_comps"] = RentCompsCSVIngestor().ingest(session, path)
 
     return inserted
+
+
+def _existing_path(path: str | os.PathLike[str] | None, default: Path) -> Path | None:
+    """``path``, or ``default`` when unset, as a ``Path`` if the file exists."""
+
+    if not path:
+        path = default
+    if not os.path.exists(path):
+        return None
+    return path if isinstance(path, Path) else Path(path)
@@ -2,35 +2,46 @@
 
 from __future__ import annotations
 
+import functools
 
+import numpy as np
+
+# (lower bound, upper bound, marginal rate) for each taxed band; the first
+# £250,000 is charged at 0%.
+_STAMP_DUTY_BANDS = (
+    (250_000.0, 925_000.0, 0.05),
+    (925_000.0, 1_500_000.0, 0.10),
+    (1_500_000.0, float("inf"), 0.12),
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def compute_residential_stamp_duty(purchase_price: float) -> float:
     """Estimate UK residential stamp duty from simplified progressive bands.
 
     Assumption: standard residential rates (England/NI style banding), no
     first-time buyer relief and no additional dwelling surcharge. Keep this
-    configurable when adapting to specific transaction cases.
+    configurable when adapting to specific transaction cases. Results are
+    memoized per price, since scenario runs re-cost the same purchase price.
     """
 
     if purchase_price < 0:
         raise ValueError("Purchase price must be non-negative")
 
-    bands = [
-        (250_000, 0.00),
-        (925_000, 0.05),
-        (1_500_000, 0.10),
-        (float("inf"), 0.12),
-    ]
-
-    remaining = purchase_price
-    lower = 0.0
     duty = 0.0
+    for lower, upper, rate in _STAMP_DUTY_BANDS:
+        duty += rate * (min(max(purchase_price, lower), upper) - lower)
+    return duty
+
 
-    for upper, rate in bands:
-        taxable = max(min(remaining, upper - lower), 0.0)
-        duty += taxable * rate
-        remaining -= taxable
-        lower = upper
-        if remaining <= 0:
-            break
+def compute_residential_stamp_duty_vec(purchase_prices: np.ndarray) -> np.ndarray:
+    """Element-wise :func:`compute_residential_stamp_duty` for an array of prices."""
+
+    prices = np.asarray(purchase_prices, dtype=float)
+    if (prices < 0).any():
+        raise ValueError("Purchase price must be non-negative")
 
+    duty = np.zeros_like(prices)
+    for lower, upper, rate in _STAMP_DUTY_BANDS:
+        duty += rate * (np.clip(prices, lower, upper) - lower)
     return duty
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import pytest
+from sqlalchemy import func, select
+
+from src.adapters import csv_utils
+from src.adapters.land_registry import LandRegistryCSVIngestor
+from src.adapters.rent_comps_adapter import RentCompsCSVIngestor
+from src.db.base import get_engine, get_session_factory, session_scope
+from src.db.init_db import init_db
+from src.db.models import RentComp, Transaction
+
+
+def _session_factory():
+    engine = get_engine("sqlite://")
+    init_db(engine)
+    return get_session_factory(engine)
+
+
+def test_land_registry_ingest_normalizes_and_skips_invalid_rows(tmp_path) -> None:
+    csv_path = tmp_path / "transactions.csv"
+    csv_path.write_text(
+        "Postcode,Price_Paid,Date,Property_Type,New_Build,Tenure\n"
+        " e14 9ab ,450000,2021-03-15, Flat ,N,Leasehold\n"
+        "E14 9AB,bad,2022-07-11,Flat,N,Leasehold\n"
+        "M1 1AA,300000,notadate,Flat,N,Freehold\n"
+        "M1 1AA,310000,2023-01-01,,,Freehold\n",
+        encoding="utf-8",
+    )
+    session_factory = _session_factory()
+
+    with session_scope(session_factory) as session:
+        inserted = LandRegistryCSVIngestor().ingest(session, csv_path)
+
+    with session_scope(session_factory) as session:
+        rows = session.scalars(select(Transaction).order_by(Transaction.date)).all()
+
+    assert inserted == 2
+    assert [(r.postcode, r.price_paid, r.date) for r in rows] == [
+        ("E14 9AB", 450_000.0, dt.date(2021, 3, 15)),
+        ("M1 1AA", 310_000.0, dt.date(2023, 1, 1)),
+    ]
+    assert rows[0].property_type == "Flat"
+    assert rows[1].property_type is None
+    assert rows[1].new_build is None
+
+
+def test_rent_comps_ingest_handles_missing_bedrooms(tmp_path) -> None:
+    csv_path = tmp_path / "rent_comps.csv"
+    csv_path.write_text(
+        "postcode,monthly_rent,bedrooms,property_type,date,source\n"
+        " e14 9ab ,2450,2, flat ,2025-05-01, local_mock \n"
+        "M1 1AA,1450,,,2025-06-01,local_mock\n",
+        encoding="utf-8",
+    )
+    session_factory = _session_factory()
+
+    with session_scope(session_factory) as session:
+        inserted = RentCompsCSVIngestor().ingest(session, csv_path)
+
+    with session_scope(session_factory) as session:
+        rows = session.scalars(select(RentComp).order_by(RentComp.date)).all()
+
+    assert inserted == 2
+    assert (rows[0].postcode, rows[0].bedrooms, rows[0].property_type, rows[0].source) == (
+        "E14 9AB",
+        2,
+        "flat",
+        "local_mock",
+    )
+    assert rows[1].bedrooms is None
+    assert rows[1].property_type is None
+
+
+def test_land_registry_ingest_streams_in_chunks(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(csv_utils, "CSV_CHUNK_ROWS", 7)
+    monkeypatch.setattr(csv_utils, "CSV_BLOCK_BYTES", 256)
+    rows = "".join(f"M1 {i % 9}AA,{200_000 + i},2023-01-{(i % 28) + 1:02d},Flat,N,Freehold\n" for i in range(50))
+    csv_path = tmp_path / "transactions.csv"
+    csv_path.write_text("postcode,price_paid,date,property_type,new_build,tenure\n" + rows, encoding="utf-8")
+    session_factory = _session_factory()
+
+    with session_scope(session_factory) as session:
+        inserted = LandRegistryCSVIngestor().ingest(session, csv_path)
+
+    with session_scope(session_factory) as session:
+        total = session.scalar(select(func.sum(Transaction.price_paid)))
+
+    assert inserted == 50
+    assert total == pytest.approx(sum(200_000 + i for i in range(50)))
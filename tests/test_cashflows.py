@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import datetime as dt
+from dataclasses import replace
+
+import numpy as np
 import pytest
 
-from src.underwriting.cashflows import project_cash_flows
+from src.underwriting.cashflows import cash_flow_arrays, levered_cash_flow_matrix, project_cash_flows
 from src.underwriting.models import (
     AcquisitionCosts,
     ExitAssumptions,
     FinancingAssumptions,
     RentalAssumptions,
     UnderwritingInputs,
+    inputs_to_soa,
 )
 
 
@@ -37,12 +42,35 @@ def test_monthly_noi_calculation_without_debt() -> None:
     )
 
     monthly, annual, _, initial_equity = project_cash_flows(inputs)
-    month1 = monthly.loc[monthly["month"] == 1].iloc[0]
+    assert monthly["month"].iat[1] == 1
+    assert annual["year"].iat[1] == 1
+    month1 = monthly.iloc[1]
 
     expected_noi = 1_000 * (1 - 0.10) * (1 - 0.20)
     assert month1["noi"] == pytest.approx(expected_noi, rel=1e-6)
     assert month1["debt_service"] == pytest.approx(0.0)
-    assert monthly.loc[monthly["month"] == 0, "levered_cf"].iloc[0] == pytest.approx(-initial_equity)
+    assert monthly["levered_cf"].iat[0] == pytest.approx(-initial_equity)
 
-    year1_noi = annual.loc[annual["year"] == 1, "noi"].iloc[0]
+    year1_noi = annual["noi"].iat[1]
     assert year1_noi == pytest.approx(expected_noi * 12, rel=1e-6)
+
+
+def test_levered_cash_flow_matrix_matches_per_input_projection(base_inputs: UnderwritingInputs) -> None:
+    variants = [
+        base_inputs,
+        replace(base_inputs, purchase_price=1_100_000, acquisition_costs=AcquisitionCosts(stamp_duty=None)),
+        replace(base_inputs, financing=replace(base_inputs.financing, ltv=0.5, annual_interest_rate=0.0)),
+        replace(
+            base_inputs,
+            rental=replace(base_inputs.rental, market_rent_monthly=2_000, operating_expense_ratio=0.25),
+            exit=replace(base_inputs.exit, exit_multiple=15.0, sales_cost_pct=0.03),
+        ),
+    ]
+
+    matrix = levered_cash_flow_matrix(inputs_to_soa(variants))
+
+    for row, inputs in zip(matrix, variants):
+        expected = cash_flow_arrays(inputs, start_date=dt.date(2025, 1, 1))[0]["levered_cf"]
+        np.testing.assert_allclose(row, expected, rtol=1e-12)
+    with pytest.raises(ValueError):
+        levered_cash_flow_matrix(inputs_to_soa([base_inputs, replace(base_inputs, exit=replace(base_inputs.exit, hold_years=3))]))
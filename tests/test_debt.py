@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import datetime as dt
 
+import pandas as pd
 import pytest
 
-from src.underwriting.debt import build_debt_schedule
+from src.underwriting.debt import build_debt_schedule, payment_dates
 from src.underwriting.models import FinancingAssumptions
 
 
@@ -48,3 +49,25 @@ def test_interest_only_has_balloon_payment() -> None:
     # Final month carries the balloon principal payoff.
     assert schedule.loc[11, "principal"] == pytest.approx(100_000, rel=1e-6)
     assert schedule.loc[11, "closing_balance"] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_schedule_past_term_and_month_end_dates() -> None:
+    financing = FinancingAssumptions(annual_interest_rate=0.0, amortizing=True, term_years=1)
+    schedule = build_debt_schedule(
+        loan_amount=12_000,
+        financing=financing,
+        months=15,
+        start_date=dt.date(2024, 1, 31),
+    )
+
+    assert schedule["payment"].iloc[:12].tolist() == pytest.approx([1_000.0] * 12)
+    assert schedule["payment"].iloc[12:].sum() == pytest.approx(0.0)
+    assert schedule["closing_balance"].iloc[-1] == pytest.approx(0.0)
+    assert schedule["date"].iloc[:3].tolist() == [dt.date(2024, 2, 29), dt.date(2024, 3, 31), dt.date(2024, 4, 30)]
+
+
+@pytest.mark.parametrize("start_date", [dt.date(2023, 1, 15), dt.date(2023, 8, 31), dt.date(2024, 2, 29)])
+def test_payment_dates_match_calendar_month_offsets(start_date: dt.date) -> None:
+    expected = [(pd.Timestamp(start_date) + pd.DateOffset(months=k)).date() for k in range(1, 37)]
+
+    assert payment_dates(start_date, 36).tolist() == expected
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from src.db.base import get_engine, get_session_factory, session_scope
+from src.db.init_db import init_db
+from src.db.repository import add_listings, add_rates, add_transactions, list_listings
+from src.features.engineering import build_feature_bundle, build_feature_bundles, compute_postcode_transaction_stats
+
+
+def test_postcode_trend_matches_least_squares_fit() -> None:
+    engine = get_engine("sqlite://")
+    init_db(engine)
+    session_factory = get_session_factory(engine)
+
+    dates = [dt.date(2021, 3, 15), dt.date(2021, 11, 2), dt.date(2022, 6, 30), dt.date(2023, 1, 9)]
+    prices = [400_000.0, 415_000.0, 409_000.0, 432_000.0]
+    with session_scope(session_factory) as session:
+        add_transactions(
+            session,
+            [{"postcode": "E14 9AB", "price_paid": p, "date": d} for d, p in zip(dates, prices)]
+            + [{"postcode": "M1 1AA", "price_paid": 300_000.0, "date": dt.date(2023, 1, 1)}],
+        )
+
+    with session_scope(session_factory) as session:
+        stats = compute_postcode_transaction_stats(session, "E14 9AB")
+        sparse = compute_postcode_transaction_stats(session, "M1 1AA")
+        empty = compute_postcode_transaction_stats(session, "ZZ1 1ZZ")
+
+    month_index = np.array([d.year * 12 + d.month for d in dates], dtype=float)
+    slope, _ = np.polyfit(month_index, prices, deg=1)
+    avg_price = float(np.mean(prices))
+
+    assert stats["postcode_transaction_count"] == 4
+    assert stats["postcode_avg_transaction_price"] == pytest.approx(avg_price)
+    assert stats["postcode_transaction_trend_annual_pct"] == pytest.approx(slope * 12 / avg_price, rel=1e-9)
+    assert sparse["postcode_transaction_count"] == 1
+    assert sparse["postcode_transaction_trend_annual_pct"] is None
+    assert empty["postcode_transaction_count"] == 0
+    assert empty["postcode_avg_transaction_price"] is None
+
+
+def test_batch_feature_bundles_match_single_listing_bundles() -> None:
+    engine = get_engine("sqlite://")
+    init_db(engine)
+    session_factory = get_session_factory(engine)
+
+    with session_scope(session_factory) as session:
+        add_listings(
+            session,
+            [
+                {"address": f"{i} Dock Street", "postcode": postcode, "asking_price": 200_000.0 + i, "source": "test"}
+                for i, postcode in enumerate(["L3 4AE", "E14 9AB", "L3 4AE"])
+            ],
+        )
+        add_transactions(
+            session,
+            [{"postcode": "L3 4AE", "price_paid": 180_000.0 + i * 5_000, "date": dt.date(2022, 1 + i, 1)} for i in range(3)],
+        )
+        add_rates(session, [{"date": dt.date(2025, 1, 1), "rate_name": "policy_proxy", "value": 0.045}])
+
+    with session_scope(session_factory) as session:
+        listings = list_listings(session)
+        rents = [1_000.0, 1_500.0, 1_200.0]
+        batch = build_feature_bundles(session, listings, rents)
+        single = [build_feature_bundle(session, listing, rent) for listing, rent in zip(listings, rents)]
+
+    assert batch == single
+    assert batch[0]["reference_rate"] == pytest.approx(0.045)
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
 import pytest
 
-from src.underwriting.metrics import compute_irr, compute_npv
+from src.underwriting.metrics import (
+    compute_irr,
+    compute_irr_batch,
+    compute_npv,
+    compute_npv_batch,
+    equity_multiple,
+    equity_multiple_batch,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
 
 
 def test_npv_known_toy_example() -> None:
@@ -16,3 +30,71 @@ def test_irr_known_toy_example() -> None:
     irr = compute_irr(cash_flows, periods_per_year=1)
     assert irr is not None
     assert irr == pytest.approx(0.130662, rel=1e-4)
+
+
+def test_batch_metrics_match_scalar_metrics() -> None:
+    cash_flows = np.array(
+        [
+            [-100.0, 60.0, 60.0],
+            [-100.0, 10.0, 95.0],
+            [100.0, 60.0, 60.0],
+        ]
+    )
+
+    irrs = compute_irr_batch(cash_flows, periods_per_year=1)
+    npvs = compute_npv_batch(cash_flows, annual_discount_rate=0.10, periods_per_year=1)
+    multiples = equity_multiple_batch(cash_flows)
+
+    assert irrs[0] == pytest.approx(compute_irr(cash_flows[0], periods_per_year=1), rel=1e-9)
+    assert irrs[1] == pytest.approx(compute_irr(cash_flows[1], periods_per_year=1), rel=1e-9)
+    assert np.isnan(irrs[2])
+    assert multiples[:2].tolist() == pytest.approx([equity_multiple(row) for row in cash_flows[:2]])
+    assert np.isnan(multiples[2])
+    for row, npv in zip(cash_flows, npvs):
+        assert npv == pytest.approx(compute_npv(row, annual_discount_rate=0.10, periods_per_year=1), rel=1e-9)
+
+
+@pytest.mark.parametrize("hold_years", [15, 20])
+def test_batch_irr_matches_scalar_irr_on_long_holds(hold_years: int) -> None:
+    rng = np.random.default_rng(hold_years)
+    cash_flows = rng.normal(60.0, 40.0, size=(50, hold_years * 12 + 1))
+    cash_flows[:, 0] = -10_000.0
+    cash_flows[:, -1] += rng.uniform(2_000.0, 15_000.0, size=50)
+
+    irrs = compute_irr_batch(cash_flows)
+
+    for row, irr in zip(cash_flows, irrs):
+        expected = compute_irr(row)
+        if expected is None:
+            assert np.isnan(irr)
+        else:
+            assert irr == pytest.approx(expected, rel=1e-9, abs=1e-12)
+
+
+def test_compiled_batch_irr_matches_scalar_and_exits_from_worker_thread() -> None:
+    numba = pytest.importorskip("numba")
+    if numba.config.DISABLE_JIT:
+        pytest.skip("Numba JIT is disabled")
+    from src.underwriting import metrics
+
+    assert hasattr(metrics._irr_periodic_rows, "py_func")
+    rng = np.random.default_rng(3)
+    cash_flows = rng.normal(60.0, 40.0, size=(20, 121))
+    cash_flows[:, 0] = -5_000.0
+    cash_flows[:, -1] += 4_000.0
+
+    irrs = compute_irr_batch(cash_flows)
+    for row, irr in zip(cash_flows, irrs):
+        expected = compute_irr(row)
+        assert np.isnan(irr) if expected is None else irr == pytest.approx(expected, rel=1e-9)
+
+    # Streamlit calls the model off the main thread; the interpreter must still exit.
+    script = (
+        "import threading, numpy as np\n"
+        "from src.underwriting.metrics import compute_irr_batch\n"
+        "cf = np.full((4, 61), 50.0); cf[:, 0] = -2_000.0\n"
+        "worker = threading.Thread(target=compute_irr_batch, args=(cf,))\n"
+        "worker.start(); worker.join()\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script], cwd=ROOT, timeout=120)
+    assert completed.returncode == 0
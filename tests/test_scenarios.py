@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import math
+from dataclasses import replace
+
+import pandas as pd
+import pytest
+
+from src.scenarios import monte_carlo
 from src.scenarios.deterministic import run_standard_scenarios
 from src.scenarios.monte_carlo import MonteCarloConfig, run_monte_carlo
 from src.underwriting.engine import UnderwritingEngine
@@ -16,6 +23,21 @@ def test_deterministic_scenarios_shape_and_integrity(base_inputs: UnderwritingIn
     assert base_inputs.financing.annual_interest_rate == 0.05
 
 
+def test_engine_reuses_results_for_identical_inputs(base_inputs: UnderwritingInputs) -> None:
+    engine = UnderwritingEngine()
+
+    first = engine.run(base_inputs)
+    repeat = engine.run(replace(base_inputs))
+    shocked = engine.run(replace(base_inputs, discount_rate=0.09))
+
+    assert repeat.monthly_columns["levered_cf"] is first.monthly_columns["levered_cf"]
+    assert not first.monthly_columns["levered_cf"].flags.writeable
+    assert shocked.metrics["npv"] != first.metrics["npv"]
+
+    first.metrics["npv"] = 0.0
+    assert engine.run(base_inputs).metrics["npv"] == repeat.metrics["npv"] != 0.0
+
+
 def test_monte_carlo_summary_and_sample_size(base_inputs: UnderwritingInputs) -> None:
     engine = UnderwritingEngine()
 
@@ -32,3 +54,46 @@ def test_monte_carlo_summary_and_sample_size(base_inputs: UnderwritingInputs) ->
     assert "irr_p50" in summary
     assert "prob_irr_below_hurdle" in summary
     assert summary["prob_irr_below_hurdle"] is None or 0.0 <= summary["prob_irr_below_hurdle"] <= 1.0
+
+
+def test_monte_carlo_chunks_match_single_pass(base_inputs: UnderwritingInputs, monkeypatch) -> None:
+    config = MonteCarloConfig(n_simulations=50, seed=5)
+    monkeypatch.setattr(monte_carlo, "SIMULATION_CHUNK_SIZE", 50)
+    single_pass = run_monte_carlo(base_inputs, config=config)
+    monkeypatch.setattr(monte_carlo, "SIMULATION_CHUNK_SIZE", 7)
+    chunked = run_monte_carlo(base_inputs, config=config)
+
+    pd.testing.assert_frame_equal(chunked["simulations"], single_pass["simulations"])
+    assert chunked["summary"] == single_pass["summary"]
+
+
+@pytest.mark.parametrize(("hold_years", "annual_interest_rate", "n_simulations"), [(5, 0.05, 5), (15, 0.08, 40), (20, 0.12, 40)])
+def test_monte_carlo_matches_engine_per_simulation(
+    base_inputs: UnderwritingInputs,
+    hold_years: int,
+    annual_interest_rate: float,
+    n_simulations: int,
+) -> None:
+    engine = UnderwritingEngine()
+    base_inputs = replace(
+        base_inputs,
+        financing=replace(base_inputs.financing, annual_interest_rate=annual_interest_rate),
+        exit=replace(base_inputs.exit, hold_years=hold_years),
+    )
+
+    sims = run_monte_carlo(base_inputs, config=MonteCarloConfig(n_simulations=n_simulations, seed=11))["simulations"]
+
+    for sim in sims.itertuples():
+        sim_inputs = replace(
+            base_inputs,
+            rental=replace(base_inputs.rental, annual_rent_growth=sim.rent_growth, vacancy_rate=sim.vacancy),
+            financing=replace(base_inputs.financing, annual_interest_rate=sim.interest_rate),
+            exit=replace(base_inputs.exit, exit_cap_rate=sim.exit_cap_rate),
+        )
+
+        metrics = engine.run(sim_inputs).metrics
+        if metrics["irr"] is None:
+            assert math.isnan(sim.irr)
+        else:
+            assert sim.irr == pytest.approx(metrics["irr"], rel=1e-9)
+        assert sim.npv == pytest.approx(metrics["npv"], rel=1e-9)
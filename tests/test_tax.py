@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.utils.tax import compute_residential_stamp_duty, compute_residential_stamp_duty_vec
+
+
+@pytest.mark.parametrize(
+    ("price", "expected"),
+    [
+        (0.0, 0.0),
+        (250_000.0, 0.0),
+        (400_000.0, 7_500.0),
+        (925_000.0, 33_750.0),
+        (1_200_000.0, 61_250.0),
+        (2_000_000.0, 151_250.0),
+    ],
+)
+def test_stamp_duty_bands(price: float, expected: float) -> None:
+    assert compute_residential_stamp_duty(price) == pytest.approx(expected)
+
+
+def test_vectorized_stamp_duty_matches_scalar() -> None:
+    prices = np.array([0.0, 125_000.0, 250_000.0, 612_345.0, 925_000.0, 1_499_999.0, 3_250_000.0])
+
+    np.testing.assert_array_equal(
+        compute_residential_stamp_duty_vec(prices),
+        [compute_residential_stamp_duty(price) for price in prices],
+    )
+    with pytest.raises(ValueError):
+        compute_residential_stamp_duty_vec(np.array([100_000.0, -1.0]))